@@ -4,6 +4,9 @@ SLP 가중치, 유해인자, 공정 순서 등을 종합하여 배치의 적합
 """
 
 from typing import Dict, List, Any, Tuple
+
+import numpy as np
+
 from utils.geometry_utils import GeometryUtils
 
 
@@ -146,11 +149,19 @@ class FitnessCalculator:
     
     def _calculate_adjacency_fitness(self, layout: List[Dict[str, Any]]) -> float:
         """SLP 가중치 기반 인접성 적합도 계산"""
-        total_score = 0.0
+        if len(layout) < 2:
+            return 0.0
+        
+        centers = np.array([(rect['x'] + rect['width'] / 2, rect['y'] + rect['height'] / 2) 
+                            for rect in layout])
+        
+        # 모든 공정 쌍의 가중치 수집 후 점수는 한 번에 계산
+        first_indices, second_indices = [], []
+        weights, preferred_gaps = [], []
         
         for i, rect1 in enumerate(layout):
-            for rect2 in layout[i + 1:]:
-                distance = self.geometry.calculate_center_distance(rect1, rect2)
+            for j in range(i + 1, len(layout)):
+                rect2 = layout[j]
                 
                 # 인접성 가중치 조회
                 weight_key1 = f"{rect1['id']}-{rect2['id']}"
@@ -160,16 +171,17 @@ class FitnessCalculator:
                               self.adjacency_weights.get(weight_key2) or 
                               {'weight': 2, 'preferred_gap': 100})
                 
-                weight = weight_info['weight']
-                preferred_gap = weight_info.get('preferred_gap', 100)
-                
-                # SLP 가중치에 따른 점수 계산
-                score = self.geometry.calculate_adjacency_score(
-                    rect1, rect2, weight, preferred_gap
-                )
-                total_score += score
+                first_indices.append(i)
+                second_indices.append(j)
+                weights.append(weight_info['weight'])
+                preferred_gaps.append(weight_info.get('preferred_gap', 100))
+        
+        # SLP 가중치에 따른 점수 계산
+        scores = self.geometry.calculate_adjacency_scores(
+            centers[first_indices], centers[second_indices], weights, preferred_gaps
+        )
         
-        return total_score
+        return float(scores.sum())
     
     def _calculate_sequence_compliance_bonus(self, layout: List[Dict[str, Any]]) -> float:
         """공정 순서 준수 보너스 계산"""
@@ -6,6 +6,7 @@
 import time
 from typing import Dict, List, Any, Optional
 from optimization.base_engine import OptimizationEngine
+from utils.geometry_utils import Rect
 
 
 class ImprovedExhaustiveSearchOptimizer(OptimizationEngine):
@@ -39,6 +40,10 @@ class ImprovedExhaustiveSearchOptimizer(OptimizationEngine):
         self.quality_threshold = 800           # 고품질 솔루션 기준 점수
         self.progress_update_interval = 50     # 진행률 업데이트 간격
         
+        # 고정구역 슬롯 사각형 (페널티 계산용, optimize 호출마다 배치 생성기의 고정구역에서 다시 변환)
+        self._fixed_zone_rects: List[Rect] = []
+        self._refresh_fixed_zone_rects()
+        
         print(f"🚀 {self.name} 초기화 완료")
     
     def optimize(self, 
@@ -71,6 +76,7 @@ class ImprovedExhaustiveSearchOptimizer(OptimizationEngine):
         
         start_time = time.time()
         self._reset_performance_stats()
+        self._refresh_fixed_zone_rects()
         
         # Phase 1: 주공정 배치 조합 생성 (개선된 알고리즘 적용)
         phase_start = time.time()
@@ -150,12 +156,16 @@ class ImprovedExhaustiveSearchOptimizer(OptimizationEngine):
                 self.fitness_calculator.adjacency_weights
             )
             
+            # 페널티 계산용 슬롯 사각형 (한 번만 변환)
+            rects = [Rect.from_dict(rect) for rect in complete_layout]
+            
             # 적합도 평가 (페널티 포함)
-            fitness = self._evaluate_solution_with_penalties(complete_layout)
+            penalty = self._calculate_total_penalty(rects)
+            fitness = self.fitness_calculator.calculate_fitness(complete_layout) - penalty
             
             # 제약 조건 검사 및 분류
             is_constraint_valid = self.constraint_handler.is_valid(complete_layout)
-            has_boundary_violations = self._has_boundary_violations(complete_layout)
+            has_boundary_violations = self._has_boundary_violations(rects)
             
             # 통계 업데이트
             if is_constraint_valid:
@@ -178,7 +188,7 @@ class ImprovedExhaustiveSearchOptimizer(OptimizationEngine):
                 'evaluation_time': time.time(),
                 'constraint_valid': is_constraint_valid,
                 'boundary_violations': has_boundary_violations,
-                'penalty_score': self._calculate_total_penalty(complete_layout)
+                'penalty_score': penalty
             }
             
             # 솔루션 수집
@@ -262,75 +272,89 @@ class ImprovedExhaustiveSearchOptimizer(OptimizationEngine):
         base_fitness = self.fitness_calculator.calculate_fitness(layout)
         
         # 제약 조건 위반 페널티 계산
-        penalty = self._calculate_total_penalty(layout)
+        penalty = self._calculate_total_penalty([Rect.from_dict(rect) for rect in layout])
         
         # 최종 적합도 = 기본 적합도 - 페널티
         final_fitness = base_fitness - penalty
         
         return final_fitness
     
-    def _calculate_total_penalty(self, layout: List[Dict[str, Any]]) -> float:
+    def _calculate_total_penalty(self, rects: List[Rect]) -> float:
         """총 페널티 계산"""
         
         penalty = 0.0
         
         # 1. 경계 위반 페널티
-        penalty += self._calculate_boundary_penalty(layout)
+        penalty += self._calculate_boundary_penalty(rects)
         
         # 2. 겹침 페널티
-        penalty += self._calculate_overlap_penalty(layout)
+        penalty += self._calculate_overlap_penalty(rects)
         
         # 3. 고정구역 침범 페널티
-        penalty += self._calculate_fixed_zone_penalty(layout)
+        penalty += self._calculate_fixed_zone_penalty(rects)
         
         return penalty
     
-    def _calculate_boundary_penalty(self, layout: List[Dict[str, Any]]) -> float:
+    def _refresh_fixed_zone_rects(self):
+        """배치 생성기의 현재 고정구역을 슬롯 사각형으로 변환해 저장 (실행 중에는 재사용)"""
+        self._fixed_zone_rects = [Rect.from_dict(zone) for zone in self.layout_generator.fixed_zones or []]
+    
+    def _calculate_boundary_penalty(self, rects: List[Rect]) -> float:
         """경계 위반 페널티 계산"""
         penalty = 0.0
+        site_width = self.layout_generator.site_width
+        site_height = self.layout_generator.site_height
         
-        for rect in layout:
+        for rect in rects:
             # 경계 위반 거리 계산
-            x_violation = max(0, -rect['x']) + max(0, rect['x'] + rect['width'] - self.layout_generator.site_width)
-            y_violation = max(0, -rect['y']) + max(0, rect['y'] + rect['height'] - self.layout_generator.site_height)
+            x_violation = max(0, -rect.x) + max(0, rect.x + rect.width - site_width)
+            y_violation = max(0, -rect.y) + max(0, rect.y + rect.height - site_height)
             
             # 위반 거리에 비례한 페널티
             penalty += (x_violation + y_violation) * 10
         
         return penalty
     
-    def _calculate_overlap_penalty(self, layout: List[Dict[str, Any]]) -> float:
+    def _calculate_overlap_penalty(self, rects: List[Rect]) -> float:
         """겹침 페널티 계산"""
         penalty = 0.0
         
-        for i in range(len(layout)):
-            for j in range(i + 1, len(layout)):
-                rect1, rect2 = layout[i], layout[j]
+        for i in range(len(rects)):
+            rect1 = rects[i]
+            for j in range(i + 1, len(rects)):
+                rect2 = rects[j]
                 
-                if self.layout_generator.geometry.rectangles_overlap(rect1, rect2):
-                    overlap_area = self.layout_generator.geometry.calculate_overlap_area(rect1, rect2)
-                    penalty += overlap_area * 100  # 겹침 면적 × 100
+                # 겹치는 영역 계산 (겹치지 않으면 한쪽 길이가 0 이하)
+                overlap_width = min(rect1.x + rect1.width, rect2.x + rect2.width) - max(rect1.x, rect2.x)
+                overlap_height = min(rect1.y + rect1.height, rect2.y + rect2.height) - max(rect1.y, rect2.y)
+                if overlap_width > 0 and overlap_height > 0:
+                    penalty += overlap_width * overlap_height * 100  # 겹침 면적 × 100
         
         return penalty
     
-    def _calculate_fixed_zone_penalty(self, layout: List[Dict[str, Any]]) -> float:
+    def _calculate_fixed_zone_penalty(self, rects: List[Rect]) -> float:
         """고정구역 침범 페널티 계산"""
         penalty = 0.0
+        fixed_zones = self._fixed_zone_rects
         
-        for rect in layout:
-            for fixed_zone in self.layout_generator.fixed_zones:
-                if self.layout_generator.geometry.rectangles_overlap(rect, fixed_zone):
-                    overlap_area = self.layout_generator.geometry.calculate_overlap_area(rect, fixed_zone)
-                    penalty += overlap_area * 50  # 침범 면적 × 50
+        for rect in rects:
+            for fixed_zone in fixed_zones:
+                overlap_width = min(rect.x + rect.width, fixed_zone.x + fixed_zone.width) - max(rect.x, fixed_zone.x)
+                overlap_height = min(rect.y + rect.height, fixed_zone.y + fixed_zone.height) - max(rect.y, fixed_zone.y)
+                if overlap_width > 0 and overlap_height > 0:
+                    penalty += overlap_width * overlap_height * 50  # 침범 면적 × 50
         
         return penalty
     
-    def _has_boundary_violations(self, layout: List[Dict[str, Any]]) -> bool:
+    def _has_boundary_violations(self, rects: List[Rect]) -> bool:
         """경계 위반 여부 확인"""
-        for rect in layout:
-            if (rect['x'] < 0 or rect['y'] < 0 or 
-                rect['x'] + rect['width'] > self.layout_generator.site_width or 
-                rect['y'] + rect['height'] > self.layout_generator.site_height):
+        site_width = self.layout_generator.site_width
+        site_height = self.layout_generator.site_height
+        
+        for rect in rects:
+            if (rect.x < 0 or rect.y < 0 or 
+                rect.x + rect.width > site_width or 
+                rect.y + rect.height > site_height):
                 return True
         return False
     
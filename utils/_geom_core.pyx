@@ -0,0 +1,50 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+"""
+기하학적 판정 C 확장 모듈 (선택적)
+GeometryUtils의 겹침 판정 핵심 루프를 GIL 없이 실행하는 Cython 구현입니다.
+
+빌드 (프로젝트 루트에서):
+    cythonize -i utils/_geom_core.pyx
+
+OpenMP로 컴파일하면 prange 루프가 멀티코어로 병렬 실행되며, 빌드하지 않으면
+geometry_utils가 Numba 또는 NumPy 구현으로 대체합니다.
+"""
+
+import numpy as np
+from cython.parallel cimport prange
+
+
+cdef inline bint rectangles_overlap_c(const double* rect1, const double* rect2) noexcept nogil:
+    """두 [x, y, width, height] 사각형의 겹침 여부"""
+    return (rect1[0] + rect1[2] > rect2[0] and rect2[0] + rect2[2] > rect1[0] and
+            rect1[1] + rect1[3] > rect2[1] and rect2[1] + rect2[3] > rect1[1])
+
+
+def overlap_any_batch(const double[:, ::1] candidates, const double[:, ::1] existing):
+    """
+    후보 사각형마다 기존 사각형 중 하나라도 겹치는지 판정
+
+    Args:
+        candidates: 후보 사각형 (G, 4) [x, y, width, height] C 연속 float64 배열
+        existing: 기존 사각형 (N, 4) [x, y, width, height] C 연속 float64 배열
+
+    Returns:
+        (G,) uint8 배열 (1 = 겹침)
+    """
+    cdef Py_ssize_t num_candidates = candidates.shape[0]
+    cdef Py_ssize_t num_existing = existing.shape[0]
+    cdef Py_ssize_t i, j
+
+    result = np.zeros(num_candidates, dtype=np.uint8)
+    cdef unsigned char[::1] hits = result
+
+    if num_existing == 0:
+        return result
+
+    for i in prange(num_candidates, nogil=True, schedule='static'):
+        for j in range(num_existing):
+            if rectangles_overlap_c(&candidates[i, 0], &existing[j, 0]):
+                hits[i] = 1
+                break
+
+    return result
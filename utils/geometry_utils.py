@@ -3,224 +3,529 @@
 사각형 겹침 검사, 거리 계산 등 배치 최적화에 필요한 기하학적 계산을 제공합니다.
 """
 
+import heapq
 import math
-from typing import Dict, List, Any, Tuple, Optional
+import sys
+from dataclasses import dataclass, replace
+from typing import Dict, List, Any, Tuple, Optional, Union
 
+import numpy as np
 
-class GeometryUtils:
-    """기하학적 계산 유틸리티 클래스"""
+# Numba (선택적) - 없으면 NumPy 구현으로 대체
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Cython 확장 (선택적, `cythonize -i utils/_geom_core.pyx`로 빌드) - 없으면 Numba/NumPy 구현 사용
+try:
+    from utils._geom_core import overlap_any_batch
+    CGEOM_AVAILABLE = True
+except ImportError:
+    CGEOM_AVAILABLE = False
+
+# Shapely 2.x STRtree (선택적) - 없으면 NumPy 전체 쌍 비교로 대체
+try:
+    import shapely
+    from shapely import STRtree
+    SHAPELY_AVAILABLE = True
+except ImportError:
+    SHAPELY_AVAILABLE = False
+
+
+# Python 3.10+에서는 dataclass가 __slots__를 생성 (이전 버전은 일반 dataclass)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class Rect:
+    """
+    __slots__ 기반 경량 사각형
+
+    내부 반복문에서 dict 키 조회(rect['x']) 대신 슬롯 속성 접근(rect.x)을 사용하기 위한 타입입니다.
+    배치 데이터는 외부 인터페이스에서 dict로 유지되며, 반복 계산 직전에 한 번 변환해서 사용합니다.
+    """
+
+    x: int
+    y: int
+    width: int
+    height: int
+    id: str = ''
+    rotated: bool = False
+
+    @classmethod
+    def from_dict(cls, rect: Dict[str, Any]) -> 'Rect':
+        """dict 사각형 {'x', 'y', 'width', 'height', ...}에서 생성"""
+        return cls(rect['x'], rect['y'], rect['width'], rect['height'],
+                   rect.get('id', ''), rect.get('rotated', False))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """dict 사각형으로 변환"""
+        return {
+            'x': self.x,
+            'y': self.y,
+            'width': self.width,
+            'height': self.height,
+            'id': self.id,
+            'rotated': self.rotated
+        }
+
+
+# 사각형 목록 또는 (N, 4) [x, y, width, height] 배열
+RectSequence = Union[List[Dict[str, Any]], np.ndarray]
+
+
+def _to_array(rectangles: RectSequence) -> np.ndarray:
+    """
+    사각형 목록을 (N, 4) [x, y, width, height] float64 배열로 변환
+
+    이미 배열이면 복사 없이 그대로 반환하므로, 반복 호출하는 쪽은 한 번 변환한 배열을 넘기면 됩니다.
+    """
+    if isinstance(rectangles, np.ndarray):
+        return rectangles.reshape(-1, 4).astype(np.float64, copy=False)
+
+    array = np.empty((len(rectangles), 4), dtype=np.float64)
+    for i, rect in enumerate(rectangles):
+        if isinstance(rect, Rect):
+            array[i] = (rect.x, rect.y, rect.width, rect.height)
+        else:
+            array[i] = (rect['x'], rect['y'], rect['width'], rect['height'])
+    return array
+
+
+# SLP 가중치별 인접성 점수 표 (weight // 2 인덱스: X, U, O, I, E, A)
+# 점수 = max(0, 상한 - 기울기 × |거리 - 선호거리|), X는 별도 식 사용
+_ADJACENCY_CAPS = np.array([0.0, 50.0, 100.0, 150.0, 200.0, 300.0])
+_ADJACENCY_SLOPES = np.array([0.0, 0.0, 1.0, 1.5, 2.0, 3.0])
+
+# 겹침 행렬을 나눠 계산할 행 블록 크기
+_OVERLAP_TILE_ROWS = 256
+
+# 그리드 후보 위치를 나눠 처리할 행 수 (브로드캐스팅 중간 배열의 메모리 상한)
+_GRID_CHUNK_SIZE = 4096
+
+
+def _centers(rects_array: np.ndarray) -> np.ndarray:
+    """(N, 4) 배열의 사각형 중심점 (N, 2) 배열"""
+    return rects_array[:, :2] + rects_array[:, 2:] * 0.5
+
+
+def _edge_arrays(rects_array: np.ndarray) -> np.ndarray:
+    """
+    (N, 4) [x, y, width, height] 배열을 (4, N) [left, top, right, bottom] SoA 배열로 변환
+
+    모든 좌표가 정수이면 범위에 맞는 가장 좁은 정수형(int16 → int32)으로 줄여 비교 연산의
+    메모리 대역폭을 줄이고 SIMD 레인 수를 늘립니다 (배치 좌표는 보통 ±32767mm 이내의 정수).
+    면적 계산에 쓰이는 _to_array 결과는 곱셈 오버플로를 피하기 위해 float64로 유지합니다.
+    """
+    left, top = rects_array[:, 0], rects_array[:, 1]
+    edges = np.stack([left, top, left + rects_array[:, 2], top + rects_array[:, 3]])
+
+    if edges.size == 0 or not np.array_equal(edges, np.trunc(edges)):
+        return edges
+
+    edge_min, edge_max = edges.min(), edges.max()
+    for dtype in (np.int16, np.int32):
+        dtype_info = np.iinfo(dtype)
+        if dtype_info.min <= edge_min and edge_max <= dtype_info.max:
+            return edges.astype(dtype)
+    return edges
+
+
+def _grid_candidates(max_x: int, max_y: int, grid_size: int) -> np.ndarray:
+    """
+    (0, 0) ~ (max_x, max_y) 범위의 그리드 후보 좌표를 (G, 2) 배열로 생성
+
+    순서는 기존 `for x: for y:` 이중 루프와 같은 x 우선 순서입니다.
+    """
+    xs = np.arange(0, max_x + 1, grid_size)
+    ys = np.arange(0, max_y + 1, grid_size)
+    grid_x, grid_y = np.meshgrid(xs, ys, indexing='ij')
+    return np.stack([grid_x.ravel(), grid_y.ravel()], axis=1)
+
+
+# JIT 커널은 첫 호출 때 컴파일 (cache=True는 디스크 캐시에 패키지 경로 'utils.geometry_utils'를 기록해
+# `python utils/geometry_utils.py`로 직접 실행할 때 캐시를 불러오지 못하므로 사용하지 않음)
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, inline='always')
+    def _rects_overlap_kernel(x1, y1, w1, h1, x2, y2, w2, h2):
+        """두 사각형 겹침 여부 (JIT 스칼라 커널)"""
+        return x1 + w1 > x2 and x2 + w2 > x1 and y1 + h1 > y2 and y2 + h2 > y1
+
+    @njit(fastmath=True)
+    def _any_overlap(rects_array, x, y, width, height):
+        """테스트 사각형이 배열의 사각형 중 하나라도 겹치는지 확인 (첫 겹침에서 조기 종료)"""
+        for i in range(rects_array.shape[0]):
+            if _rects_overlap_kernel(x, y, width, height,
+                                     rects_array[i, 0], rects_array[i, 1],
+                                     rects_array[i, 2], rects_array[i, 3]):
+                return True
+        return False
+
+    @njit(fastmath=True, parallel=True)
+    def _free_grid_kernel(rects_array, num_x, num_y, grid_size, width, height, out):
+        """그리드 후보 (x 우선 순서)별 비겹침 마스크 (병렬 JIT 커널, 후보마다 독립된 out 원소에 기록)"""
+        for k in prange(num_x * num_y):
+            x = (k // num_y) * grid_size
+            y = (k % num_y) * grid_size
+            out[k] = not _any_overlap(rects_array, x, y, width, height)
+
+
+def _free_position_mask(rects_array: np.ndarray, candidates: np.ndarray,
+                        width: float, height: float) -> np.ndarray:
+    """
+    후보 위치에 width×height 사각형을 놓았을 때 기존 사각형과 겹치지 않는지 일괄 판정
+
+    C 확장이 있으면 C 구현, 없으면 NumPy 브로드캐스팅으로 판정합니다.
+    (Numba 경로는 후보 배열 없이 그리드를 직접 도는 _free_grid_kernel을 _free_grid_positions에서 사용)
+
+    Args:
+        rects_array: 기존 사각형 (N, 4) 배열
+        candidates: 후보 좌표 (G, 2) 배열
+        width: 배치할 사각형 너비
+        height: 배치할 사각형 높이
+
+    Returns:
+        (G,) bool 배열 (True = 겹치지 않음)
+    """
+    if CGEOM_AVAILABLE:
+        sizes = np.broadcast_to(np.array([width, height], dtype=np.float64), (len(candidates), 2))
+        test_rects = np.ascontiguousarray(np.hstack([candidates, sizes]), dtype=np.float64)
+        return overlap_any_batch(test_rects, np.ascontiguousarray(rects_array, dtype=np.float64)) == 0
+
+    left = rects_array[None, :, 0]
+    top = rects_array[None, :, 1]
+    right = left + rects_array[None, :, 2]
+    bottom = top + rects_array[None, :, 3]
+
+    free = np.empty(len(candidates), dtype=bool)
+    for start in range(0, len(candidates), _GRID_CHUNK_SIZE):
+        chunk = candidates[start:start + _GRID_CHUNK_SIZE]
+        cand_x = chunk[:, 0, None]
+        cand_y = chunk[:, 1, None]
+        hits = (cand_x + width > left) & (right > cand_x) & (cand_y + height > top) & (bottom > cand_y)
+        free[start:start + len(chunk)] = ~hits.any(axis=1)
+    return free
+
+
+def _free_grid_positions(rects_array: np.ndarray, max_x: int, max_y: int, grid_size: int,
+                         width: float, height: float) -> np.ndarray:
+    """
+    (0, 0) ~ (max_x, max_y) 그리드 후보 중 width×height 사각형이 기존 사각형과 겹치지 않는 좌표
+
+    구현 선택 순서는 C 확장 → Numba → NumPy입니다. Numba 경로는 후보 좌표 배열을 만들지 않고
+    병렬 커널이 그리드 인덱스에서 좌표를 직접 계산합니다.
+
+    Args:
+        rects_array: 기존 사각형 (N, 4) 배열
+        max_x: x 좌표 상한
+        max_y: y 좌표 상한
+        grid_size: 그리드 간격
+        width: 배치할 사각형 너비
+        height: 배치할 사각형 높이
+
+    Returns:
+        (K, 2) 좌표 배열 (x 우선 순서)
+    """
+    if CGEOM_AVAILABLE or not NUMBA_AVAILABLE:
+        candidates = _grid_candidates(max_x, max_y, grid_size)
+        return candidates[_free_position_mask(rects_array, candidates, width, height)]
+
+    num_x = len(range(0, max_x + 1, grid_size))
+    num_y = len(range(0, max_y + 1, grid_size))
+    free = np.empty(num_x * num_y, dtype=np.uint8)
+    _free_grid_kernel(np.ascontiguousarray(rects_array, dtype=np.float64), num_x, num_y,
+                      float(grid_size), float(width), float(height), free)
+
+    index = np.flatnonzero(free)
+    return np.stack([index // num_y * grid_size, index % num_y * grid_size], axis=1)
+
+
+def _build_strtree(rects_array: np.ndarray) -> 'STRtree':
+    """(N, 4) 배열의 사각형으로 Shapely STRtree 생성 (트리 인덱스 = 배열 행 번호)"""
+    left, top = rects_array[:, 0], rects_array[:, 1]
+    return STRtree(shapely.box(left, top, left + rects_array[:, 2], top + rects_array[:, 3]))
+
+
+def _candidate_pairs(rects_array: np.ndarray, margin: float = 0.0) -> np.ndarray:
+    """
+    경계 사각형이 margin 이내로 맞닿거나 겹치는 사각형 쌍 (i < j) 찾기
+
+    Shapely가 있으면 STRtree 공간 인덱스로 후보를 조회하고, 없으면 NumPy로 전체 쌍을 비교합니다.
+    결과는 정확한 판정 전의 후보 집합(경계 접촉 포함)이며, 기존 이중 루프와 같은 (i, j) 순서로 정렬됩니다.
+
+    Args:
+        rects_array: (N, 4) [x, y, width, height] 배열
+        margin: 경계 사각형 확장 거리
+
+    Returns:
+        (M, 2) 인덱스 쌍 배열
+    """
+    if len(rects_array) < 2:
+        return np.empty((0, 2), dtype=np.intp)
+
+    left, top = rects_array[:, 0], rects_array[:, 1]
+    right, bottom = left + rects_array[:, 2], top + rects_array[:, 3]
+
+    if SHAPELY_AVAILABLE:
+        tree = _build_strtree(rects_array)
+        query_boxes = shapely.box(left - margin, top - margin, right + margin, bottom + margin)
+        pairs = tree.query(query_boxes).T
+    else:
+        pairs = np.argwhere((right[:, None] + margin >= left[None, :]) &
+                            (right[None, :] >= left[:, None] - margin) &
+                            (bottom[:, None] + margin >= top[None, :]) &
+                            (bottom[None, :] >= top[:, None] - margin))
+
+    pairs = pairs[pairs[:, 0] < pairs[:, 1]]
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def rectangles_overlap(rect1: Dict[str, Any], rect2: Dict[str, Any]) -> bool:
+    """
+    두 사각형이 겹치는지 확인
     
-    @staticmethod
-    def rectangles_overlap(rect1: Dict[str, Any], rect2: Dict[str, Any]) -> bool:
-        """
-        두 사각형이 겹치는지 확인
-        
-        Args:
-            rect1: 첫 번째 사각형 {'x': int, 'y': int, 'width': int, 'height': int}
-            rect2: 두 번째 사각형
-        
-        Returns:
-            겹침 여부
-        """
-        # 사각형 경계 계산
-        r1_left = rect1['x']
-        r1_right = rect1['x'] + rect1['width']
-        r1_top = rect1['y']
-        r1_bottom = rect1['y'] + rect1['height']
-        
-        r2_left = rect2['x']
-        r2_right = rect2['x'] + rect2['width']
-        r2_top = rect2['y']
-        r2_bottom = rect2['y'] + rect2['height']
-        
-        # 겹침 검사 (하나라도 분리되어 있으면 겹치지 않음)
-        if (r1_right <= r2_left or r2_right <= r1_left or 
-            r1_bottom <= r2_top or r2_bottom <= r1_top):
-            return False
-        
-        return True
-    
-    @staticmethod
-    def calculate_center_distance(rect1: Dict[str, Any], rect2: Dict[str, Any]) -> float:
-        """
-        두 사각형의 중심점 간 거리 계산
-        
-        Args:
-            rect1: 첫 번째 사각형
-            rect2: 두 번째 사각형
-        
-        Returns:
-            중심점 간 유클리드 거리
-        """
-        center1_x = rect1['x'] + rect1['width'] / 2
-        center1_y = rect1['y'] + rect1['height'] / 2
-        
-        center2_x = rect2['x'] + rect2['width'] / 2
-        center2_y = rect2['y'] + rect2['height'] / 2
-        
-        dx = center2_x - center1_x
-        dy = center2_y - center1_y
-        
-        return math.sqrt(dx * dx + dy * dy)
+    Args:
+        rect1: 첫 번째 사각형 {'x': int, 'y': int, 'width': int, 'height': int}
+        rect2: 두 번째 사각형
     
-    @staticmethod
-    def calculate_edge_distance(rect1: Dict[str, Any], rect2: Dict[str, Any]) -> float:
-        """
-        두 사각형의 가장 가까운 모서리 간 거리 계산
-        
-        Args:
-            rect1: 첫 번째 사각형
-            rect2: 두 번째 사각형
-        
-        Returns:
-            가장 가까운 모서리 간 거리 (겹치면 0)
-        """
-        if GeometryUtils.rectangles_overlap(rect1, rect2):
-            return 0.0
-        
-        # 사각형 경계 계산
-        r1_left = rect1['x']
-        r1_right = rect1['x'] + rect1['width']
-        r1_top = rect1['y']
-        r1_bottom = rect1['y'] + rect1['height']
-        
-        r2_left = rect2['x']
-        r2_right = rect2['x'] + rect2['width']
-        r2_top = rect2['y']
-        r2_bottom = rect2['y'] + rect2['height']
-        
-        # 수평 거리
-        if r1_right < r2_left:
-            dx = r2_left - r1_right
-        elif r2_right < r1_left:
-            dx = r1_left - r2_right
-        else:
-            dx = 0
-        
-        # 수직 거리
-        if r1_bottom < r2_top:
-            dy = r2_top - r1_bottom
-        elif r2_bottom < r1_top:
-            dy = r1_top - r2_bottom
-        else:
-            dy = 0
-        
-        return math.sqrt(dx * dx + dy * dy)
+    Returns:
+        겹침 여부
+    """
+    # 사각형 경계 계산
+    r1_left = rect1['x']
+    r1_right = rect1['x'] + rect1['width']
+    r1_top = rect1['y']
+    r1_bottom = rect1['y'] + rect1['height']
     
-    @staticmethod
-    def calculate_overlap_area(rect1: Dict[str, Any], rect2: Dict[str, Any]) -> float:
-        """
-        두 사각형의 겹치는 면적 계산
-        
-        Args:
-            rect1: 첫 번째 사각형
-            rect2: 두 번째 사각형
-        
-        Returns:
-            겹치는 면적 (겹치지 않으면 0)
-        """
-        if not GeometryUtils.rectangles_overlap(rect1, rect2):
-            return 0.0
-        
-        # 겹치는 영역의 경계 계산
-        overlap_left = max(rect1['x'], rect2['x'])
-        overlap_right = min(rect1['x'] + rect1['width'], rect2['x'] + rect2['width'])
-        overlap_top = max(rect1['y'], rect2['y'])
-        overlap_bottom = min(rect1['y'] + rect1['height'], rect2['y'] + rect2['height'])
-        
-        overlap_width = overlap_right - overlap_left
-        overlap_height = overlap_bottom - overlap_top
-        
-        return max(0, overlap_width * overlap_height)
+    r2_left = rect2['x']
+    r2_right = rect2['x'] + rect2['width']
+    r2_top = rect2['y']
+    r2_bottom = rect2['y'] + rect2['height']
     
-    @staticmethod
-    def point_in_rectangle(point: Tuple[float, float], rect: Dict[str, Any]) -> bool:
-        """
-        점이 사각형 내부에 있는지 확인
-        
-        Args:
-            point: (x, y) 좌표
-            rect: 사각형
-        
-        Returns:
-            포함 여부
-        """
-        px, py = point
-        
-        return (rect['x'] <= px <= rect['x'] + rect['width'] and 
-                rect['y'] <= py <= rect['y'] + rect['height'])
+    # 겹침 검사 (하나라도 분리되어 있으면 겹치지 않음)
+    if (r1_right <= r2_left or r2_right <= r1_left or 
+        r1_bottom <= r2_top or r2_bottom <= r1_top):
+        return False
     
-    @staticmethod
-    def rectangle_in_bounds(rect: Dict[str, Any], width: int, height: int) -> bool:
-        """
-        사각형이 지정된 경계 내부에 완전히 포함되는지 확인
-        
-        Args:
-            rect: 확인할 사각형
-            width: 경계 너비
-            height: 경계 높이
-        
-        Returns:
-            경계 내 포함 여부
-        """
-        return (rect['x'] >= 0 and rect['y'] >= 0 and 
-                rect['x'] + rect['width'] <= width and 
-                rect['y'] + rect['height'] <= height)
+    return True
+
+
+def to_array(rectangles: RectSequence) -> np.ndarray:
+    """
+    사각형 목록을 (N, 4) [x, y, width, height] 배열로 변환
     
-    @staticmethod
-    def calculate_contact_length(rect1: Dict[str, Any], rect2: Dict[str, Any]) -> float:
-        """
-        두 사각형이 접촉하는 길이 계산
-        
-        Args:
-            rect1: 첫 번째 사각형
-            rect2: 두 번째 사각형
-        
-        Returns:
-            접촉 길이 (접촉하지 않으면 0)
-        """
-        if not GeometryUtils.rectangles_overlap(rect1, rect2) and GeometryUtils.calculate_edge_distance(rect1, rect2) > 1:
-            return 0.0
-        
-        # 수평 겹침 길이
-        horizontal_overlap = max(0, min(rect1['x'] + rect1['width'], rect2['x'] + rect2['width']) - 
-                                   max(rect1['x'], rect2['x']))
-        
-        # 수직 겹침 길이
-        vertical_overlap = max(0, min(rect1['y'] + rect1['height'], rect2['y'] + rect2['height']) - 
-                                 max(rect1['y'], rect2['y']))
-        
-        # 접촉하는 경우 겹침이 있는 방향의 길이 반환
-        if horizontal_overlap > 0 and vertical_overlap > 0:
-            # 실제로 겹치는 경우
-            return max(horizontal_overlap, vertical_overlap)
-        elif horizontal_overlap > 0:
-            # 수평으로만 겹침 (위아래로 접촉)
-            return horizontal_overlap
-        elif vertical_overlap > 0:
-            # 수직으로만 겹침 (좌우로 접촉)
-            return vertical_overlap
-        
+    Args:
+        rectangles: 사각형 목록 (dict 또는 Rect) 또는 이미 변환된 배열
+    
+    Returns:
+        (N, 4) float64 배열
+    """
+    return _to_array(rectangles)
+
+
+def overlap_matrix(rects_a: RectSequence, rects_b: Optional[RectSequence] = None) -> np.ndarray:
+    """
+    두 사각형 집합 간의 겹침 여부를 한 번에 계산 (브로드캐스팅)
+    
+    Args:
+        rects_a: 사각형 목록 또는 (N, 4) 배열
+        rects_b: 사각형 목록 또는 (M, 4) 배열 (None이면 rects_a 자신과 비교)
+    
+    Returns:
+        (N, M) bool 배열, [i, j]는 rects_a[i]와 rects_b[j]의 겹침 여부
+    """
+    a_left, a_top, a_right, a_bottom = _edge_arrays(_to_array(rects_a))
+    if rects_b is None:
+        b_left, b_top, b_right, b_bottom = a_left, a_top, a_right, a_bottom
+    else:
+        b_left, b_top, b_right, b_bottom = _edge_arrays(_to_array(rects_b))
+    
+    # 행 블록 단위 계산 (블록별 중간 배열이 캐시에 머물도록)
+    overlaps = np.empty((len(a_left), len(b_left)), dtype=bool)
+    for start in range(0, len(a_left), _OVERLAP_TILE_ROWS):
+        rows = slice(start, start + _OVERLAP_TILE_ROWS)
+        left, top = a_left[rows, None], a_top[rows, None]
+        right, bottom = a_right[rows, None], a_bottom[rows, None]
+        overlaps[rows] = ((right > b_left) & (b_right > left) & 
+                          (bottom > b_top) & (b_bottom > top))
+    
+    return overlaps
+
+
+def calculate_center_distance(rect1: Dict[str, Any], rect2: Dict[str, Any]) -> float:
+    """
+    두 사각형의 중심점 간 거리 계산
+    
+    Args:
+        rect1: 첫 번째 사각형
+        rect2: 두 번째 사각형
+    
+    Returns:
+        중심점 간 유클리드 거리
+    """
+    center1_x = rect1['x'] + rect1['width'] / 2
+    center1_y = rect1['y'] + rect1['height'] / 2
+    
+    center2_x = rect2['x'] + rect2['width'] / 2
+    center2_y = rect2['y'] + rect2['height'] / 2
+    
+    return math.hypot(center2_x - center1_x, center2_y - center1_y)
+
+
+def calculate_center_distance_batch(targets: RectSequence, rectangles: RectSequence) -> np.ndarray:
+    """
+    여러 사각형 간의 중심점 거리를 한 번에 계산
+    
+    Args:
+        targets: 대상 사각형 목록 또는 (T, 4) 배열
+        rectangles: 비교할 사각형 목록 또는 (N, 4) 배열
+    
+    Returns:
+        (T, N) 중심점 간 거리 배열
+    """
+    target_centers = _centers(_to_array(targets))
+    centers = _centers(_to_array(rectangles))
+    
+    return np.hypot(target_centers[:, None, 0] - centers[None, :, 0], 
+                    target_centers[:, None, 1] - centers[None, :, 1])
+
+
+def calculate_edge_distance(rect1: Dict[str, Any], rect2: Dict[str, Any]) -> float:
+    """
+    두 사각형의 가장 가까운 모서리 간 거리 계산
+    
+    Args:
+        rect1: 첫 번째 사각형
+        rect2: 두 번째 사각형
+    
+    Returns:
+        가장 가까운 모서리 간 거리 (겹치면 0)
+    """
+    # 사각형 경계 계산 (한 번만 조회)
+    r1_left = rect1['x']
+    r1_right = r1_left + rect1['width']
+    r1_top = rect1['y']
+    r1_bottom = r1_top + rect1['height']
+    
+    r2_left = rect2['x']
+    r2_right = r2_left + rect2['width']
+    r2_top = rect2['y']
+    r2_bottom = r2_top + rect2['height']
+    
+    # 축별 분리 거리 (겹치거나 맞닿으면 0 → 두 축 모두 0이면 겹침)
+    dx = max(0, r2_left - r1_right, r1_left - r2_right)
+    dy = max(0, r2_top - r1_bottom, r1_top - r2_bottom)
+    
+    return math.hypot(dx, dy)
+
+
+def calculate_overlap_area(rect1: Dict[str, Any], rect2: Dict[str, Any]) -> float:
+    """
+    두 사각형의 겹치는 면적 계산
+    
+    Args:
+        rect1: 첫 번째 사각형
+        rect2: 두 번째 사각형
+    
+    Returns:
+        겹치는 면적 (겹치지 않으면 0)
+    """
+    # 겹치는 영역의 경계 계산
+    overlap_width = (min(rect1['x'] + rect1['width'], rect2['x'] + rect2['width']) - 
+                     max(rect1['x'], rect2['x']))
+    overlap_height = (min(rect1['y'] + rect1['height'], rect2['y'] + rect2['height']) - 
+                      max(rect1['y'], rect2['y']))
+    
+    # 한 축이라도 겹침 길이가 0 이하면 겹치지 않음
+    if overlap_width <= 0 or overlap_height <= 0:
         return 0.0
     
-    @staticmethod
-    def get_rectangle_bounds(rectangles: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """
-        사각형 목록의 전체 경계 사각형 계산
-        
-        Args:
-            rectangles: 사각형 목록
-        
-        Returns:
-            전체를 감싸는 경계 사각형 정보
-        """
-        if not rectangles:
-            return {'x': 0, 'y': 0, 'width': 0, 'height': 0}
-        
-        min_x = min(rect['x'] for rect in rectangles)
-        min_y = min(rect['y'] for rect in rectangles)
-        max_x = max(rect['x'] + rect['width'] for rect in rectangles)
-        max_y = max(rect['y'] + rect['height'] for rect in rectangles)
+    return overlap_width * overlap_height
+
+
+def point_in_rectangle(point: Tuple[float, float], rect: Dict[str, Any]) -> bool:
+    """
+    점이 사각형 내부에 있는지 확인
+    
+    Args:
+        point: (x, y) 좌표
+        rect: 사각형
+    
+    Returns:
+        포함 여부
+    """
+    px, py = point
+    
+    return (rect['x'] <= px <= rect['x'] + rect['width'] and 
+            rect['y'] <= py <= rect['y'] + rect['height'])
+
+
+def rectangle_in_bounds(rect: Dict[str, Any], width: int, height: int) -> bool:
+    """
+    사각형이 지정된 경계 내부에 완전히 포함되는지 확인
+    
+    Args:
+        rect: 확인할 사각형
+        width: 경계 너비
+        height: 경계 높이
+    
+    Returns:
+        경계 내 포함 여부
+    """
+    return (rect['x'] >= 0 and rect['y'] >= 0 and 
+            rect['x'] + rect['width'] <= width and 
+            rect['y'] + rect['height'] <= height)
+
+
+def calculate_contact_length(rect1: Dict[str, Any], rect2: Dict[str, Any]) -> float:
+    """
+    두 사각형이 접촉하는 길이 계산
+    
+    Args:
+        rect1: 첫 번째 사각형
+        rect2: 두 번째 사각형
+    
+    Returns:
+        접촉 길이 (접촉하지 않으면 0)
+    """
+    # 축별 부호 있는 겹침 길이 (양수 = 겹침, 0 = 맞닿음, 음수 = 떨어진 거리)
+    horizontal_overlap = (min(rect1['x'] + rect1['width'], rect2['x'] + rect2['width']) - 
+                          max(rect1['x'], rect2['x']))
+    vertical_overlap = (min(rect1['y'] + rect1['height'], rect2['y'] + rect2['height']) - 
+                        max(rect1['y'], rect2['y']))
+    
+    if horizontal_overlap > 0 and vertical_overlap > 0:
+        # 실제로 겹치는 경우
+        return max(horizontal_overlap, vertical_overlap)
+    elif horizontal_overlap > 0 and vertical_overlap >= -1:
+        # 수평으로만 겹침 (위아래로 접촉, 허용 간격 1 이내)
+        return horizontal_overlap
+    elif vertical_overlap > 0 and horizontal_overlap >= -1:
+        # 수직으로만 겹침 (좌우로 접촉, 허용 간격 1 이내)
+        return vertical_overlap
+    
+    return 0.0
+
+
+def get_rectangle_bounds(rectangles: RectSequence) -> Dict[str, Any]:
+    """
+    사각형 목록의 전체 경계 사각형 계산
+    
+    Args:
+        rectangles: 사각형 목록 또는 (N, 4) 배열
+    
+    Returns:
+        전체를 감싸는 경계 사각형 정보
+    """
+    if len(rectangles) == 0:
+        return {'x': 0, 'y': 0, 'width': 0, 'height': 0}
+    
+    if isinstance(rectangles, np.ndarray):
+        array = _to_array(rectangles)
+        min_x, min_y = array[:, :2].min(axis=0).tolist()
+        max_x, max_y = (array[:, :2] + array[:, 2:]).max(axis=0).tolist()
         
         return {
             'x': min_x,
@@ -229,315 +534,415 @@ class GeometryUtils:
             'height': max_y - min_y
         }
     
-    @staticmethod
-    def calculate_aspect_ratio(rect: Dict[str, Any]) -> float:
-        """
-        사각형의 종횡비 계산
-        
-        Args:
-            rect: 사각형
-        
-        Returns:
-            종횡비 (width / height)
-        """
-        if rect['height'] == 0:
-            return float('inf')
-        
-        return rect['width'] / rect['height']
+    # 한 번의 순회로 네 극값을 함께 갱신
+    first = rectangles[0]
+    min_x, min_y = first['x'], first['y']
+    max_x, max_y = min_x + first['width'], min_y + first['height']
     
-    @staticmethod
-    def rotate_rectangle(rect: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        사각형을 90도 회전 (width와 height 교체)
-        
-        Args:
-            rect: 원본 사각형
-        
-        Returns:
-            회전된 사각형
-        """
-        rotated = rect.copy()
-        rotated['width'] = rect['height']
-        rotated['height'] = rect['width']
-        rotated['rotated'] = not rect.get('rotated', False)
-        
-        return rotated
+    for rect in rectangles:
+        x, y = rect['x'], rect['y']
+        right, bottom = x + rect['width'], y + rect['height']
+        if x < min_x:
+            min_x = x
+        if y < min_y:
+            min_y = y
+        if right > max_x:
+            max_x = right
+        if bottom > max_y:
+            max_y = bottom
     
-    @staticmethod
-    def translate_rectangle(rect: Dict[str, Any], dx: int, dy: int) -> Dict[str, Any]:
-        """
-        사각형을 이동
-        
-        Args:
-            rect: 원본 사각형
-            dx: x축 이동 거리
-            dy: y축 이동 거리
-        
-        Returns:
-            이동된 사각형
-        """
-        translated = rect.copy()
-        translated['x'] += dx
-        translated['y'] += dy
-        
-        return translated
-    
-    @staticmethod
-    def find_free_space(rectangles: List[Dict[str, Any]], 
-                       site_width: int, 
-                       site_height: int, 
-                       min_width: int, 
-                       min_height: int) -> List[Dict[str, Any]]:
-        """
-        배치된 사각형들 사이의 빈 공간 찾기
-        
-        Args:
-            rectangles: 배치된 사각형 목록
-            site_width: 부지 너비
-            site_height: 부지 높이
-            min_width: 최소 필요 너비
-            min_height: 최소 필요 높이
-        
-        Returns:
-            사용 가능한 빈 공간 목록
-        """
-        free_spaces = []
-        grid_size = min(min_width, min_height) // 2  # 그리드 크기
-        
-        for x in range(0, site_width - min_width + 1, grid_size):
-            for y in range(0, site_height - min_height + 1, grid_size):
-                # 테스트할 영역
-                test_rect = {
-                    'x': x,
-                    'y': y,
-                    'width': min_width,
-                    'height': min_height
-                }
-                
-                # 기존 사각형과 겹치는지 확인
-                is_free = True
-                for rect in rectangles:
-                    if GeometryUtils.rectangles_overlap(test_rect, rect):
-                        is_free = False
-                        break
-                
-                if is_free:
-                    free_spaces.append(test_rect)
-        
-        return free_spaces
-    
-    @staticmethod
-    def calculate_utilization_ratio(rectangles: List[Dict[str, Any]], 
-                                  site_width: int, 
-                                  site_height: int) -> float:
-        """
-        부지 활용률 계산
-        
-        Args:
-            rectangles: 배치된 사각형 목록
-            site_width: 부지 너비
-            site_height: 부지 높이
-        
-        Returns:
-            활용률 (0~1)
-        """
-        if not rectangles:
-            return 0.0
-        
-        total_process_area = sum(rect['width'] * rect['height'] for rect in rectangles)
-        site_area = site_width * site_height
-        
-        return total_process_area / site_area if site_area > 0 else 0.0
+    return {
+        'x': min_x,
+        'y': min_y,
+        'width': max_x - min_x,
+        'height': max_y - min_y
+    }
+
+
+def calculate_aspect_ratio(rect: Dict[str, Any]) -> float:
+    """
+    사각형의 종횡비 계산
     
-    @staticmethod
-    def calculate_compactness(rectangles: List[Dict[str, Any]]) -> float:
-        """
-        배치의 컴팩트성 계산 (공정들이 얼마나 집약적으로 배치되었는가)
-        
-        Args:
-            rectangles: 배치된 사각형 목록
-        
-        Returns:
-            컴팩트성 (0~1, 높을수록 컴팩트)
-        """
-        if not rectangles:
-            return 0.0
-        
-        # 전체 공정 면적
+    Args:
+        rect: 사각형
+    
+    Returns:
+        종횡비 (width / height)
+    """
+    if rect['height'] == 0:
+        return float('inf')
+    
+    return rect['width'] / rect['height']
+
+
+def rotate_rectangle(rect: Union[Dict[str, Any], Rect]) -> Union[Dict[str, Any], Rect]:
+    """
+    사각형을 90도 회전 (width와 height 교체)
+    
+    Args:
+        rect: 원본 사각형 (dict 또는 Rect)
+    
+    Returns:
+        회전된 사각형
+    """
+    if isinstance(rect, Rect):
+        return replace(rect, width=rect.height, height=rect.width, rotated=not rect.rotated)
+    
+    return {**rect, 'width': rect['height'], 'height': rect['width'], 
+            'rotated': not rect.get('rotated', False)}
+
+
+def translate_rectangle(rect: Union[Dict[str, Any], Rect], dx: int, dy: int) -> Union[Dict[str, Any], Rect]:
+    """
+    사각형을 이동
+    
+    Args:
+        rect: 원본 사각형 (dict 또는 Rect)
+        dx: x축 이동 거리
+        dy: y축 이동 거리
+    
+    Returns:
+        이동된 사각형
+    """
+    if isinstance(rect, Rect):
+        return replace(rect, x=rect.x + dx, y=rect.y + dy)
+    
+    return {**rect, 'x': rect['x'] + dx, 'y': rect['y'] + dy}
+
+
+def find_free_space(rectangles: List[Dict[str, Any]], 
+                   site_width: int, 
+                   site_height: int, 
+                   min_width: int, 
+                   min_height: int) -> List[Dict[str, Any]]:
+    """
+    배치된 사각형들 사이의 빈 공간 찾기
+    
+    Args:
+        rectangles: 배치된 사각형 목록
+        site_width: 부지 너비
+        site_height: 부지 높이
+        min_width: 최소 필요 너비
+        min_height: 최소 필요 높이
+    
+    Returns:
+        사용 가능한 빈 공간 목록
+    """
+    free_spaces = []
+    grid_size = min(min_width, min_height) // 2  # 그리드 크기
+    
+    # 모든 그리드 후보를 한 번에 기존 사각형과 겹침 판정
+    positions = _free_grid_positions(_to_array(rectangles), site_width - min_width, 
+                                     site_height - min_height, grid_size, min_width, min_height)
+    
+    for x, y in positions.tolist():
+        free_spaces.append({
+            'x': x,
+            'y': y,
+            'width': min_width,
+            'height': min_height
+        })
+    
+    return free_spaces
+
+
+def calculate_utilization_ratio(rectangles: RectSequence, 
+                              site_width: int, 
+                              site_height: int) -> float:
+    """
+    부지 활용률 계산
+    
+    Args:
+        rectangles: 배치된 사각형 목록 또는 (N, 4) 배열
+        site_width: 부지 너비
+        site_height: 부지 높이
+    
+    Returns:
+        활용률 (0~1)
+    """
+    if len(rectangles) == 0:
+        return 0.0
+    
+    if isinstance(rectangles, np.ndarray):
+        array = _to_array(rectangles)
+        total_process_area = float((array[:, 2] * array[:, 3]).sum())
+    else:
         total_process_area = sum(rect['width'] * rect['height'] for rect in rectangles)
-        
-        # 최소 경계 사각형 면적
-        bounds = GeometryUtils.get_rectangle_bounds(rectangles)
-        bounding_area = bounds['width'] * bounds['height']
-        
-        return total_process_area / bounding_area if bounding_area > 0 else 0.0
+    site_area = site_width * site_height
     
-    @staticmethod
-    def find_closest_rectangles(target_rect: Dict[str, Any], 
-                               rectangles: List[Dict[str, Any]], 
-                               k: int = 3) -> List[Tuple[Dict[str, Any], float]]:
-        """
-        대상 사각형에 가장 가까운 k개의 사각형 찾기
-        
-        Args:
-            target_rect: 대상 사각형
-            rectangles: 검색할 사각형 목록
-            k: 반환할 개수
-        
-        Returns:
-            (사각형, 거리) 튜플의 리스트 (거리 오름차순)
-        """
-        distances = []
-        
-        for rect in rectangles:
-            if rect != target_rect:  # 자기 자신 제외
-                distance = GeometryUtils.calculate_center_distance(target_rect, rect)
-                distances.append((rect, distance))
-        
-        # 거리 순으로 정렬하고 상위 k개 반환
-        distances.sort(key=lambda x: x[1])
-        return distances[:k]
-    
-    @staticmethod
-    def calculate_adjacency_score(rect1: Dict[str, Any], 
-                                rect2: Dict[str, Any], 
-                                weight: int, 
-                                preferred_gap: float = 100.0) -> float:
-        """
-        두 사각형 간의 인접성 점수 계산 (SLP 기반)
-        
-        Args:
-            rect1: 첫 번째 사각형
-            rect2: 두 번째 사각형
-            weight: SLP 가중치 (0, 2, 4, 6, 8, 10)
-            preferred_gap: 선호 거리
-        
-        Returns:
-            인접성 점수 (높을수록 좋음)
-        """
-        distance = GeometryUtils.calculate_center_distance(rect1, rect2)
-        
-        # SLP 가중치별 점수 계산
-        if weight == 10:  # A (Absolutely necessary)
-            deviation = abs(distance - preferred_gap)
-            return max(0, 300 - deviation * 3)
-        elif weight == 8:  # E (Especially important)
-            deviation = abs(distance - preferred_gap)
-            return max(0, 200 - deviation * 2)
-        elif weight == 6:  # I (Important)
-            deviation = abs(distance - preferred_gap)
-            return max(0, 150 - deviation * 1.5)
-        elif weight == 4:  # O (Ordinary closeness)
-            deviation = abs(distance - preferred_gap)
-            return max(0, 100 - deviation)
-        elif weight == 2:  # U (Unimportant)
-            return 50  # 중립
-        elif weight == 0:  # X (Undesirable)
-            if distance < preferred_gap:
-                return -(preferred_gap - distance) * 5  # 페널티
-            else:
-                return min(distance - preferred_gap, 100)  # 보너스
-        
-        return 0
+    return total_process_area / site_area if site_area > 0 else 0.0
+
+
+def calculate_compactness(rectangles: List[Dict[str, Any]]) -> float:
+    """
+    배치의 컴팩트성 계산 (공정들이 얼마나 집약적으로 배치되었는가)
     
-    @staticmethod
-    def generate_non_overlapping_positions(existing_rects: List[Dict[str, Any]], 
-                                         new_rect_size: Tuple[int, int], 
-                                         site_width: int, 
-                                         site_height: int, 
-                                         grid_size: int = 25) -> List[Tuple[int, int]]:
-        """
-        겹치지 않는 배치 위치들을 생성
-        
-        Args:
-            existing_rects: 기존 사각형 목록
-            new_rect_size: 새 사각형 크기 (width, height)
-            site_width: 부지 너비
-            site_height: 부지 높이
-            grid_size: 그리드 크기
-        
-        Returns:
-            유효한 위치 (x, y) 좌표 리스트
-        """
-        valid_positions = []
-        new_width, new_height = new_rect_size
-        
-        for x in range(0, site_width - new_width + 1, grid_size):
-            for y in range(0, site_height - new_height + 1, grid_size):
-                test_rect = {
-                    'x': x,
-                    'y': y,
-                    'width': new_width,
-                    'height': new_height
-                }
-                
-                # 기존 사각형과 겹치지 않는지 확인
-                is_valid = True
-                for existing_rect in existing_rects:
-                    if GeometryUtils.rectangles_overlap(test_rect, existing_rect):
-                        is_valid = False
-                        break
-                
-                if is_valid:
-                    valid_positions.append((x, y))
-        
-        return valid_positions
-    
-    @staticmethod
-    def calculate_layout_center(rectangles: List[Dict[str, Any]]) -> Tuple[float, float]:
-        """
-        배치된 사각형들의 중심점 계산
-        
-        Args:
-            rectangles: 사각형 목록
-        
-        Returns:
-            중심점 (x, y) 좌표
-        """
-        if not rectangles:
-            return (0.0, 0.0)
-        
-        bounds = GeometryUtils.get_rectangle_bounds(rectangles)
-        center_x = bounds['x'] + bounds['width'] / 2
-        center_y = bounds['y'] + bounds['height'] / 2
-        
-        return (center_x, center_y)
+    Args:
+        rectangles: 배치된 사각형 목록
     
-    @staticmethod
-    def check_minimum_distances(rectangles: List[Dict[str, Any]], 
-                              minimum_distances: Dict[str, Dict[str, float]]) -> List[str]:
-        """
-        최소 거리 제약 조건 위반 확인
-        
-        Args:
-            rectangles: 배치된 사각형 목록
-            minimum_distances: {id1: {id2: min_distance}} 형태의 최소 거리 맵
-        
-        Returns:
-            위반된 제약 조건 목록
-        """
-        violations = []
-        
-        for i, rect1 in enumerate(rectangles):
-            id1 = rect1['id']
-            
-            for rect2 in rectangles[i + 1:]:
-                id2 = rect2['id']
-                
-                # 최소 거리 요구사항 확인
-                min_dist1 = minimum_distances.get(id1, {}).get(id2, 0)
-                min_dist2 = minimum_distances.get(id2, {}).get(id1, 0)
-                required_min_distance = max(min_dist1, min_dist2)
-                
-                if required_min_distance > 0:
-                    actual_distance = GeometryUtils.calculate_edge_distance(rect1, rect2)
-                    
-                    if actual_distance < required_min_distance:
-                        violations.append(
-                            f"{id1}-{id2}: 거리 {actual_distance:.1f} < 최소 {required_min_distance:.1f}"
-                        )
-        
+    Returns:
+        컴팩트성 (0~1, 높을수록 컴팩트)
+    """
+    if not rectangles:
+        return 0.0
+    
+    # 전체 공정 면적
+    total_process_area = sum(rect['width'] * rect['height'] for rect in rectangles)
+    
+    # 최소 경계 사각형 면적
+    bounds = get_rectangle_bounds(rectangles)
+    bounding_area = bounds['width'] * bounds['height']
+    
+    return total_process_area / bounding_area if bounding_area > 0 else 0.0
+
+
+def find_closest_rectangles(target_rect: Dict[str, Any], 
+                           rectangles: List[Dict[str, Any]], 
+                           k: int = 3) -> List[Tuple[Dict[str, Any], float]]:
+    """
+    대상 사각형에 가장 가까운 k개의 사각형 찾기
+    
+    Args:
+        target_rect: 대상 사각형
+        rectangles: 검색할 사각형 목록
+        k: 반환할 개수
+    
+    Returns:
+        (사각형, 거리) 튜플의 리스트 (거리 오름차순)
+    """
+    target_x = target_rect['x'] + target_rect['width'] / 2
+    target_y = target_rect['y'] + target_rect['height'] / 2
+    
+    # 순위 비교에는 제곱 거리만 사용 (sqrt는 선택된 k개에만 적용)
+    squared_distances = []
+    
+    for rect in rectangles:
+        if rect != target_rect:  # 자기 자신 제외
+            dx = rect['x'] + rect['width'] / 2 - target_x
+            dy = rect['y'] + rect['height'] / 2 - target_y
+            squared_distances.append((rect, dx * dx + dy * dy))
+    
+    # 거리 순 상위 k개만 선택 (O(N log k))
+    closest = heapq.nsmallest(k, squared_distances, key=lambda x: x[1])
+    return [(rect, math.sqrt(squared_distance)) for rect, squared_distance in closest]
+
+
+def calculate_adjacency_score(rect1: Dict[str, Any], 
+                            rect2: Dict[str, Any], 
+                            weight: int, 
+                            preferred_gap: float = 100.0) -> float:
+    """
+    두 사각형 간의 인접성 점수 계산 (SLP 기반)
+    
+    Args:
+        rect1: 첫 번째 사각형
+        rect2: 두 번째 사각형
+        weight: SLP 가중치 (0, 2, 4, 6, 8, 10)
+        preferred_gap: 선호 거리
+    
+    Returns:
+        인접성 점수 (높을수록 좋음)
+    """
+    distance = calculate_center_distance(rect1, rect2)
+    
+    # SLP 가중치별 점수 계산
+    if weight == 10:  # A (Absolutely necessary)
+        deviation = abs(distance - preferred_gap)
+        return max(0, 300 - deviation * 3)
+    elif weight == 8:  # E (Especially important)
+        deviation = abs(distance - preferred_gap)
+        return max(0, 200 - deviation * 2)
+    elif weight == 6:  # I (Important)
+        deviation = abs(distance - preferred_gap)
+        return max(0, 150 - deviation * 1.5)
+    elif weight == 4:  # O (Ordinary closeness)
+        deviation = abs(distance - preferred_gap)
+        return max(0, 100 - deviation)
+    elif weight == 2:  # U (Unimportant)
+        return 50  # 중립
+    elif weight == 0:  # X (Undesirable)
+        if distance < preferred_gap:
+            return -(preferred_gap - distance) * 5  # 페널티
+        else:
+            return min(distance - preferred_gap, 100)  # 보너스
+    
+    return 0
+
+
+def calculate_adjacency_scores(centers1: np.ndarray, 
+                             centers2: np.ndarray, 
+                             weights: np.ndarray, 
+                             preferred_gaps: Any = 100.0) -> np.ndarray:
+    """
+    여러 사각형 쌍의 인접성 점수를 한 번에 계산 (calculate_adjacency_score의 벡터화 버전)
+    
+    Args:
+        centers1: 첫 번째 사각형들의 중심점 (M, 2) 배열
+        centers2: 두 번째 사각형들의 중심점 (M, 2) 배열
+        weights: 쌍별 SLP 가중치 (M,) 배열 (0, 2, 4, 6, 8, 10)
+        preferred_gaps: 쌍별 선호 거리 (M,) 배열 또는 스칼라
+    
+    Returns:
+        쌍별 인접성 점수 (M,) 배열
+    """
+    centers1 = np.asarray(centers1, dtype=np.float64).reshape(-1, 2)
+    centers2 = np.asarray(centers2, dtype=np.float64).reshape(-1, 2)
+    weights = np.asarray(weights)
+    preferred_gaps = np.asarray(preferred_gaps, dtype=np.float64)
+    
+    distance = np.hypot(centers2[:, 0] - centers1[:, 0], centers2[:, 1] - centers1[:, 1])
+    
+    # 표에 없는 가중치는 0점
+    known = (weights >= 0) & (weights <= 10) & (weights % 2 == 0)
+    index = np.where(known, weights // 2, 0).astype(np.intp)
+    
+    # A, E, I, O, U: 선호 거리와의 편차에 비례해 감점
+    deviation = np.abs(distance - preferred_gaps)
+    scores = np.maximum(0.0, _ADJACENCY_CAPS[index] - _ADJACENCY_SLOPES[index] * deviation)
+    
+    # X: 가까우면 페널티, 멀면 보너스 (최대 100)
+    undesirable = np.where(distance < preferred_gaps, 
+                           -(preferred_gaps - distance) * 5, 
+                           np.minimum(distance - preferred_gaps, 100))
+    scores = np.where(index == 0, undesirable, scores)
+    
+    return np.where(known, scores, 0.0)
+
+
+def generate_non_overlapping_positions(existing_rects: List[Dict[str, Any]], 
+                                     new_rect_size: Tuple[int, int], 
+                                     site_width: int, 
+                                     site_height: int, 
+                                     grid_size: int = 25) -> np.ndarray:
+    """
+    겹치지 않는 배치 위치들을 생성
+    
+    Args:
+        existing_rects: 기존 사각형 목록
+        new_rect_size: 새 사각형 크기 (width, height)
+        site_width: 부지 너비
+        site_height: 부지 높이
+        grid_size: 그리드 크기
+    
+    Returns:
+        유효한 위치 (K, 2) int32 배열 (행 = (x, y), x 우선 순서)
+    """
+    new_width, new_height = new_rect_size
+    
+    # 모든 그리드 후보를 한 번에 기존 사각형과 겹침 판정
+    positions = _free_grid_positions(_to_array(existing_rects), site_width - new_width, 
+                                     site_height - new_height, grid_size, new_width, new_height)
+    
+    return positions.astype(np.int32)
+
+
+def calculate_layout_center(rectangles: List[Dict[str, Any]]) -> Tuple[float, float]:
+    """
+    배치된 사각형들의 중심점 계산
+    
+    Args:
+        rectangles: 사각형 목록
+    
+    Returns:
+        중심점 (x, y) 좌표
+    """
+    if not rectangles:
+        return (0.0, 0.0)
+    
+    bounds = get_rectangle_bounds(rectangles)
+    center_x = bounds['x'] + bounds['width'] / 2
+    center_y = bounds['y'] + bounds['height'] / 2
+    
+    return (center_x, center_y)
+
+
+def check_minimum_distances(rectangles: List[Dict[str, Any]], 
+                          minimum_distances: Dict[str, Dict[str, float]]) -> List[str]:
+    """
+    최소 거리 제약 조건 위반 확인
+    
+    Args:
+        rectangles: 배치된 사각형 목록
+        minimum_distances: {id1: {id2: min_distance}} 형태의 최소 거리 맵
+    
+    Returns:
+        위반된 제약 조건 목록
+    """
+    violations = []
+    
+    # 가장 큰 최소 거리 이내에 있는 쌍만 후보로 검사 (그보다 먼 쌍은 위반할 수 없음)
+    max_required_distance = max(
+        (distance for targets in minimum_distances.values() for distance in targets.values()),
+        default=0
+    )
+    if max_required_distance <= 0:
         return violations
+    
+    rects_array = _to_array(rectangles)
+    pairs = _candidate_pairs(rects_array, max_required_distance)
+    
+    # 중심점과 반대각선 길이 (원형 경계로 빠르게 배제하기 위해 미리 계산)
+    centers = (rects_array[:, :2] + rects_array[:, 2:] / 2).tolist()
+    half_diagonals = (np.hypot(rects_array[:, 2], rects_array[:, 3]) / 2).tolist()
+    
+    for i, j in pairs.tolist():
+        rect1, rect2 = rectangles[i], rectangles[j]
+        id1, id2 = rect1['id'], rect2['id']
+        
+        # 최소 거리 요구사항 확인
+        min_dist1 = minimum_distances.get(id1, {}).get(id2, 0)
+        min_dist2 = minimum_distances.get(id2, {}).get(id1, 0)
+        required_min_distance = max(min_dist1, min_dist2)
+        
+        if required_min_distance > 0:
+            # 중심 거리가 (반대각선 합 + 최소 거리)보다 멀면 모서리 거리도 최소 거리 이상
+            center_dx = centers[i][0] - centers[j][0]
+            center_dy = centers[i][1] - centers[j][1]
+            reject_radius = half_diagonals[i] + half_diagonals[j] + required_min_distance
+            if center_dx * center_dx + center_dy * center_dy > reject_radius * reject_radius:
+                continue
+            
+            actual_distance = calculate_edge_distance(rect1, rect2)
+            
+            if actual_distance < required_min_distance:
+                violations.append(
+                    f"{id1}-{id2}: 거리 {actual_distance:.1f} < 최소 {required_min_distance:.1f}"
+                )
+    
+    return violations
+
+
+class GeometryUtils:
+    """
+    기하학적 계산 유틸리티 클래스
+    
+    기존 코드 호환용 네임스페이스입니다. 모든 메서드는 같은 이름의 모듈 수준 함수를 가리키며,
+    반복 호출 경로에서는 모듈 함수를 직접 호출하는 것이 속성 조회가 적습니다.
+    """
+    
+    rectangles_overlap = staticmethod(rectangles_overlap)
+    to_array = staticmethod(to_array)
+    overlap_matrix = staticmethod(overlap_matrix)
+    calculate_center_distance = staticmethod(calculate_center_distance)
+    calculate_center_distance_batch = staticmethod(calculate_center_distance_batch)
+    calculate_edge_distance = staticmethod(calculate_edge_distance)
+    calculate_overlap_area = staticmethod(calculate_overlap_area)
+    point_in_rectangle = staticmethod(point_in_rectangle)
+    rectangle_in_bounds = staticmethod(rectangle_in_bounds)
+    calculate_contact_length = staticmethod(calculate_contact_length)
+    get_rectangle_bounds = staticmethod(get_rectangle_bounds)
+    calculate_aspect_ratio = staticmethod(calculate_aspect_ratio)
+    rotate_rectangle = staticmethod(rotate_rectangle)
+    translate_rectangle = staticmethod(translate_rectangle)
+    find_free_space = staticmethod(find_free_space)
+    calculate_utilization_ratio = staticmethod(calculate_utilization_ratio)
+    calculate_compactness = staticmethod(calculate_compactness)
+    find_closest_rectangles = staticmethod(find_closest_rectangles)
+    calculate_adjacency_score = staticmethod(calculate_adjacency_score)
+    calculate_adjacency_scores = staticmethod(calculate_adjacency_scores)
+    generate_non_overlapping_positions = staticmethod(generate_non_overlapping_positions)
+    calculate_layout_center = staticmethod(calculate_layout_center)
+    check_minimum_distances = staticmethod(check_minimum_distances)
 
 
 class LayoutGeometry:
@@ -553,7 +958,13 @@ class LayoutGeometry:
         """
         self.site_width = site_width
         self.site_height = site_height
-        self.utils = GeometryUtils()
+        
+        # 반복 질의용 캐시 (set_rectangles로 설정, move/invalidate로 갱신)
+        self._rects_array = np.empty((0, 4), dtype=np.float64)
+        self._centers = np.empty((0, 2), dtype=np.float64)
+        self._tree = None           # STRtree (None이면 다음 질의 시 재구축)
+        self._moved = set()         # 트리 구축 이후 이동된 행 (트리 위치가 오래됨)
+        self._version = 0
     
     def center_layout(self, rectangles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -568,7 +979,7 @@ class LayoutGeometry:
         if not rectangles:
             return rectangles
         
-        bounds = self.utils.get_rectangle_bounds(rectangles)
+        bounds = get_rectangle_bounds(rectangles)
         
         # 중앙 정렬을 위한 오프셋 계산
         offset_x = (self.site_width - bounds['width']) // 2 - bounds['x']
@@ -577,7 +988,7 @@ class LayoutGeometry:
         # 모든 사각형에 오프셋 적용
         centered_rectangles = []
         for rect in rectangles:
-            centered_rect = self.utils.translate_rectangle(rect, offset_x, offset_y)
+            centered_rect = translate_rectangle(rect, offset_x, offset_y)
             centered_rectangles.append(centered_rect)
         
         return centered_rectangles
@@ -599,35 +1010,183 @@ class LayoutGeometry:
             'statistics': {}
         }
         
-        # 부지 경계 확인
-        for rect in rectangles:
-            if not self.utils.rectangle_in_bounds(rect, self.site_width, self.site_height):
+        # 한 번의 순회로 경계 위반, 총 면적, 전체 경계, 좌표 배열을 함께 계산
+        site_width, site_height = self.site_width, self.site_height
+        rows = []
+        total_area = 0
+        min_x = min_y = max_x = max_y = 0
+        
+        for index, rect in enumerate(rectangles):
+            x, y, width, height = rect['x'], rect['y'], rect['width'], rect['height']
+            right, bottom = x + width, y + height
+            rows.append((x, y, width, height))
+            total_area += width * height
+            
+            if index == 0:
+                min_x, min_y, max_x, max_y = x, y, right, bottom
+            else:
+                min_x, min_y = min(min_x, x), min(min_y, y)
+                max_x, max_y = max(max_x, right), max(max_y, bottom)
+            
+            if x < 0 or y < 0 or right > site_width or bottom > site_height:
                 validation_result['is_valid'] = False
                 validation_result['violations'].append(
                     f"공정 '{rect['id']}'가 부지 경계를 벗어남"
                 )
         
-        # 겹침 확인
-        for i, rect1 in enumerate(rectangles):
-            for rect2 in rectangles[i + 1:]:
-                if self.utils.rectangles_overlap(rect1, rect2):
-                    validation_result['is_valid'] = False
-                    validation_result['violations'].append(
-                        f"공정 '{rect1['id']}'와 '{rect2['id']}'가 겹침"
-                    )
+        # 겹침 확인 (공간 인덱스 후보 쌍만 배열로 정밀 검사)
+        rects_array = np.array(rows, dtype=np.float64).reshape(-1, 4)
+        pairs = _candidate_pairs(rects_array)
+        if len(pairs):
+            first, second = rects_array[pairs[:, 0]], rects_array[pairs[:, 1]]
+            overlapping = ((first[:, 0] + first[:, 2] > second[:, 0]) & 
+                           (second[:, 0] + second[:, 2] > first[:, 0]) & 
+                           (first[:, 1] + first[:, 3] > second[:, 1]) & 
+                           (second[:, 1] + second[:, 3] > first[:, 1]))
+            for i, j in pairs[overlapping].tolist():
+                validation_result['is_valid'] = False
+                validation_result['violations'].append(
+                    f"공정 '{rectangles[i]['id']}'와 '{rectangles[j]['id']}'가 겹침"
+                )
         
-        # 통계 계산
+        # 통계 계산 (위 순회의 누적값 재사용)
+        bounds_width, bounds_height = max_x - min_x, max_y - min_y
+        bounding_area = bounds_width * bounds_height
+        site_area = site_width * site_height
         validation_result['statistics'] = {
             'process_count': len(rectangles),
-            'utilization_ratio': self.utils.calculate_utilization_ratio(
-                rectangles, self.site_width, self.site_height
-            ),
-            'compactness': self.utils.calculate_compactness(rectangles),
-            'layout_bounds': self.utils.get_rectangle_bounds(rectangles)
+            'utilization_ratio': total_area / site_area if rows and site_area > 0 else 0.0,
+            'compactness': total_area / bounding_area if bounding_area > 0 else 0.0,
+            'layout_bounds': {
+                'x': min_x,
+                'y': min_y,
+                'width': bounds_width,
+                'height': bounds_height
+            }
         }
         
         return validation_result
     
+    # 이동된 사각형 비율이 이 값을 넘으면 STRtree 전체 재구축
+    TREE_REBUILD_RATIO = 0.1
+    
+    @property
+    def version(self) -> int:
+        """캐시된 사각형 배열의 변경 횟수 (외부 캐시 무효화 판단용)"""
+        return self._version
+    
+    def set_rectangles(self, rectangles: RectSequence):
+        """
+        반복 질의에 사용할 사각형 목록 설정 (경계 배열 캐시 생성)
+        
+        Args:
+            rectangles: 사각형 목록 또는 (N, 4) 배열
+        """
+        self._rects_array = np.array(_to_array(rectangles), dtype=np.float64)
+        self._centers = _centers(self._rects_array)
+        self.invalidate()
+    
+    def move(self, index: int, dx: float, dy: float):
+        """
+        캐시된 사각형 하나를 이동 (배열 행만 갱신)
+        
+        Args:
+            index: 사각형 인덱스
+            dx: x축 이동 거리
+            dy: y축 이동 거리
+        """
+        self._rects_array[index, 0] += dx
+        self._rects_array[index, 1] += dy
+        self._centers[index, 0] += dx
+        self._centers[index, 1] += dy
+        self.invalidate(index)
+    
+    def invalidate(self, index: Optional[int] = None):
+        """
+        캐시 무효화
+        
+        Args:
+            index: 변경된 사각형 인덱스 (None이면 공간 인덱스 전체 재구축)
+        """
+        self._version += 1
+        
+        if index is None:
+            self._tree = None
+            self._moved.clear()
+            return
+        
+        self._moved.add(index)
+        if len(self._moved) > len(self._rects_array) * self.TREE_REBUILD_RATIO:
+            self._tree = None
+            self._moved.clear()
+    
+    def _get_tree(self) -> Optional['STRtree']:
+        """캐시된 STRtree 반환 (필요 시 재구축, Shapely가 없으면 None)"""
+        if not SHAPELY_AVAILABLE:
+            return None
+        
+        if self._tree is None:
+            self._tree = _build_strtree(self._rects_array)
+            self._moved.clear()
+        
+        return self._tree
+    
+    def find_overlaps(self, index: int) -> List[int]:
+        """
+        캐시된 사각형 중 index 사각형과 겹치는 사각형 찾기
+        
+        트리 구축 이후 이동된 사각형은 트리 대신 배열로 직접 검사하므로 
+        한 사각형씩 이동하며 검증하는 경우 트리를 매번 재구축하지 않습니다.
+        
+        Args:
+            index: 대상 사각형 인덱스
+        
+        Returns:
+            겹치는 사각형 인덱스 목록 (오름차순)
+        """
+        rects = self._rects_array
+        tree = self._get_tree()
+        
+        if tree is None:
+            candidates = np.arange(len(rects))
+        else:
+            x, y, width, height = rects[index]
+            candidates = tree.query(shapely.box(x, y, x + width, y + height))
+            if self._moved:
+                candidates = np.union1d(candidates, np.fromiter(self._moved, dtype=np.intp))
+        
+        candidates = candidates[candidates != index]
+        overlaps = overlap_matrix(rects[index], rects[candidates])[0]
+        
+        return np.sort(candidates[overlaps]).tolist()
+    
+    def center_distances(self, index: int) -> np.ndarray:
+        """
+        캐시된 사각형 index와 모든 캐시된 사각형 간의 중심점 거리
+        
+        중심점은 set_rectangles/move 시점에 미리 계산되어 질의마다 다시 계산하지 않습니다.
+        
+        Args:
+            index: 대상 사각형 인덱스
+        
+        Returns:
+            (N,) 중심점 거리 배열 (자기 자신은 0)
+        """
+        offsets = self._centers - self._centers[index]
+        return np.hypot(offsets[:, 0], offsets[:, 1])
+    
+    def find_all_overlaps(self) -> List[Tuple[int, int]]:
+        """
+        캐시된 사각형 중 겹치는 모든 쌍 찾기
+        
+        Returns:
+            (i, j) 인덱스 쌍 목록 (i < j, 오름차순)
+        """
+        pairs = []
+        for i in range(len(self._rects_array)):
+            pairs.extend((i, j) for j in self.find_overlaps(i) if j > i)
+        return pairs
+    
     def optimize_spacing(self, rectangles: List[Dict[str, Any]], 
                         target_spacing: float = 50.0) -> List[Dict[str, Any]]:
         """
@@ -681,6 +1240,11 @@ if __name__ == "__main__":
     adj_score = utils.calculate_adjacency_score(rect1, rect2, weight=8, preferred_gap=100.0)
     print(f"인접성 점수 (weight=8): {adj_score:.1f}")
     
+    adj_scores = utils.calculate_adjacency_scores(
+        [(60, 50), (60, 50)], [(195, 50), (195, 50)], weights=[8, 0], preferred_gaps=100.0
+    )
+    print(f"인접성 점수 일괄 계산 (weight=8, 0): {adj_scores.round(1).tolist()}")
+    
     # LayoutGeometry 테스트
     print("\n🔧 LayoutGeometry 테스트")
     layout_geom = LayoutGeometry(1000, 800)
@@ -3,20 +3,53 @@
 최적화 진행 과정을 비동기적으로 모니터링하고 시각화합니다.
 """
 
+import os
+import sys
 import time
+from contextlib import contextmanager
 import matplotlib
-matplotlib.use('TkAgg')  # 명시적으로 백엔드 설정
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba_array
 from typing import Dict, List, Any, Optional
-import threading
-import queue
 import numpy as np
 
 
+@contextmanager
+def _deferred_draw(fig):
+    """
+    블록 안의 아티스트 변경이 개별 draw_idle을 예약하지 않도록 지연
+    
+    stale 콜백(대화형 모드의 자동 draw_idle)을 잠시 끊고, 블록이 끝났을 때 그림이 실제로
+    stale 상태(축 범위 변경 등 blitting 대상이 아닌 변경)인 경우에만 draw_idle을 한 번 요청합니다.
+    """
+    stale_callback = fig.stale_callback
+    fig.stale_callback = None
+    try:
+        yield
+    finally:
+        fig.stale_callback = stale_callback
+        # pyplot이 관리하지 않는 그림(헤드리스 Agg)은 저장할 때 렌더링되므로 요청하지 않음
+        if stale_callback is not None and fig.stale:
+            fig.canvas.draw_idle()
+
+
 class RealtimeVisualizer:
     """실시간 최적화 진행 시각화기 (논블로킹 버전)"""
     
+    # 적합도 기록 링 버퍼 크기 (가장 최근 값만 유지)
+    FITNESS_HISTORY_SIZE = 10_000
+    
+    # 공정 유형 → 색상 인덱스 (_colors_tuple 순서, 그 외 유형은 기본 회색)
+    COLOR_INDEX = {'main': 0, 'sub': 1, 'fixed': 2}
+    DEFAULT_COLOR_INDEX = 3
+    
+    # 미리 만들어 두는 공정 라벨 수 (이보다 공정이 많으면 그때 추가 생성)
+    MAX_LABELS = 100
+    
+    # 갱신되는 아티스트를 blitting으로 그릴지 여부 (False면 일반 아티스트로 그림에 포함)
+    USE_BLIT = True
+    
     def __init__(self, site_width: int, site_height: int, update_interval: float = 1.0):
         """
         초기화
@@ -37,13 +70,41 @@ class RealtimeVisualizer:
             'current': 0,
             'total': 0,
             'best_fitness': 0,
-            'fitness_history': [],
             'start_time': None
         }
         
-        # 스레드 안전한 업데이트 큐
-        self.update_queue = queue.Queue()
-        self.visualization_thread = None
+        # 적합도 기록 (고정 크기 링 버퍼, 최고값은 누적 갱신)
+        self._fit = np.empty(self.FITNESS_HISTORY_SIZE, dtype=np.float32)
+        self._fit_count = 0
+        self._best = -np.inf
+        
+        # 최신 업데이트 슬롯 (생산자는 덮어쓰기만 하고 타이머 콜백은 최신 값만 읽음, 락 없음)
+        # 게시용 딕셔너리 두 개를 번갈아 재사용 (게시마다 새로 할당하지 않음)
+        self._slots = tuple(
+            {'seq': 0, 'current': 0, 'total': 0, 'best_fitness': 0.0,
+             'current_layout': [], 'layout_version': 0, 'timestamp': 0.0}
+            for _ in range(2)
+        )
+        self._slot_index = 0
+        self._publish_seq = 0
+        self._applied_seq = 0
+        self._latest = None
+        
+        # 그림과 타이머 (start_optimization에서 메인 스레드에 생성)
+        self.fig = None
+        self._timer = None
+        
+        # 게시 빈도 제한 (타이머가 update_interval마다 최신 값 하나만 쓰므로 그 사이 게시는 버려짐)
+        self._min_interval = update_interval
+        self._last_enqueue = 0.0
+        
+        # 배치 참조와 버전 (게시 시 복사하지 않고, 타이머 콜백이 버전이 바뀌었을 때만 스냅샷)
+        self._layout_ref = []
+        self._layout_version = 0
+        self._applied_layout_version = 0
+        
+        # 영역별 변경 플래그 (_apply_update에서 설정, 프레임을 그린 뒤 초기화)
+        self._dirty = dict.fromkeys(('layout', 'fitness', 'progress', 'stats'), False)
         
         # 색상 매핑
         self.process_colors = {
@@ -51,37 +112,105 @@ class RealtimeVisualizer:
             'sub': '#4ECDC4',       # 청록 계열 (부공정)
             'fixed': '#95A5A6'      # 회색 (고정구역)
         }
+        self._colors_tuple = (self.process_colors['main'], self.process_colors['sub'], 
+                              self.process_colors['fixed'], '#CCCCCC')
+        self._colors_rgba = to_rgba_array(self._colors_tuple)
+        
+        # 그리기용 배치 SoA 배열 (배치가 바뀔 때 한 번만 변환)
+        self._xs = self._ys = self._ws = self._hs = np.empty(0, dtype=np.float32)
+        self._color_idx = np.empty(0, dtype=np.uint8)
+        self._label_texts = []
         
-        # matplotlib 설정
-        plt.rcParams['font.family'] = ['DejaVu Sans', 'Arial', 'sans-serif']  # 한글 폰트 문제 회피
-        plt.rcParams['axes.unicode_minus'] = False
+        # matplotlib 설정 (pyplot/GUI 백엔드는 start_optimization에서 처음 로드)
+        matplotlib.rcParams['font.family'] = ['DejaVu Sans', 'Arial', 'sans-serif']  # 한글 폰트 문제 회피
+        matplotlib.rcParams['axes.unicode_minus'] = False
         
         print(f"📺 논블로킹 시각화기 초기화: {site_width}×{site_height}m")
     
     def start_optimization(self):
-        """최적화 시각화 시작"""
+        """최적화 시각화 시작 (메인 스레드에서 호출)"""
+        import matplotlib.pyplot as plt
+        
         self.is_active = True
-        self.progress_data['start_time'] = time.time()
-        self.progress_data['fitness_history'] = []
+        self._reset_state()
         
-        # 시각화 스레드 시작
-        self.visualization_thread = threading.Thread(target=self._visualization_worker, daemon=True)
-        self.visualization_thread.start()
+        try:
+            # 시각화 창 설정 (GUI 백엔드는 메인 스레드에서만 안전)
+            self.fig, self.axes = plt.subplots(2, 2, figsize=(14, 9))
+            self.fig.suptitle('공정 배치 최적화 실시간 모니터링', fontsize=14, fontweight='bold')
+            
+            # 초기 설정
+            self._setup_plots()
+            
+            plt.ion()  # 대화형 모드
+            plt.show(block=False)
+            self.fig.canvas.draw()  # 첫 전체 렌더링 (draw_event에서 배경 캐시)
+            
+            # 실행 중 사용자가 창을 닫으면 시각화만 중단 (최적화는 계속 진행)
+            self.fig.canvas.mpl_connect('close_event', self._on_close)
+            
+            # 백엔드 타이머로 주기적 갱신 (GUI 이벤트 루프에서 실행)
+            self._timer = self.fig.canvas.new_timer(interval=int(self.update_interval * 1000))
+            self._timer.add_callback(self._poll_and_draw)
+            self._timer.start()
+        
+        except Exception as e:
+            print(f"⚠️ 시각화 창 생성 오류: {str(e)}")
+            self.is_active = False
+            self.fig = None
+            return
         
         print("📺 논블로킹 시각화 시작")
     
+    def _reset_state(self):
+        """새 최적화 실행을 위해 진행 상태 초기화 (이전 실행의 배치/적합도가 그려지지 않도록 모두 비움)"""
+        self.progress_data.update(current=0, total=0, best_fitness=0, start_time=time.time())
+        self._fit_count = 0
+        self._best = -np.inf
+        self._latest = None
+        self._publish_seq = 0
+        self._applied_seq = 0
+        self._last_enqueue = 0.0
+        
+        # 이전 실행의 배치 참조/버전과 그리기용 배열
+        self._layout_ref = []
+        self._layout_version = 0
+        self._applied_layout_version = 0
+        for slot in self._slots:
+            slot['current_layout'] = []
+            slot['layout_version'] = 0
+        self.current_layout = []
+        self._ingest_layout(self.current_layout)
+        
+        for key in self._dirty:
+            self._dirty[key] = False
+    
+    def _on_close(self, event):
+        """창이 닫히면 타이머를 멈추고 이후 업데이트를 무시하도록 비활성화"""
+        self.is_active = False
+        
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        self.fig = None
+    
     def stop_optimization(self):
-        """최적화 시각화 종료"""
+        """최적화 시각화 종료 (메인 스레드에서 호출)"""
+        import matplotlib.pyplot as plt
+        
         self.is_active = False
         
-        if self.visualization_thread and self.visualization_thread.is_alive():
-            self.visualization_thread.join(timeout=2.0)
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
         
-        # matplotlib 창 닫기 (메인 스레드에서)
+        # matplotlib 창 닫기
         try:
-            plt.close('all')
+            if self.fig is not None:
+                plt.close(self.fig)
         except:
             pass
+        self.fig = None
         
         print("📺 논블로킹 시각화 종료")
     
@@ -92,76 +221,57 @@ class RealtimeVisualizer:
                        current_layout: List[Dict[str, Any]] = None):
         """
         진행 상황 업데이트 (논블로킹)
+        
+        마지막 게시 후 update_interval이 지나지 않았으면 시간 비교 한 번으로 바로 반환합니다.
+        마지막 업데이트(current >= total)는 항상 게시합니다.
         """
-        if not self.is_active:
+        fig = self.fig
+        if not self.is_active or fig is None:
             return
         
-        # 업데이트 데이터를 큐에 추가
-        update_data = {
-            'current': current,
-            'total': total,
-            'best_fitness': best_fitness,
-            'current_layout': current_layout.copy() if current_layout else [],
-            'timestamp': time.time()
-        }
-        
+        now = time.monotonic()
+        if now - self._last_enqueue < self._min_interval and current < total:
+            return
+        self._last_enqueue = now
+        
+        # 새 배치 목록이 들어온 경우에만 버전 증가
+        if current_layout and current_layout is not self._layout_ref:
+            self._layout_ref = current_layout
+            self._layout_version += 1
+        
+        # 현재 게시 중이 아닌 쪽 슬롯을 제자리에서 채운 뒤 참조 대입으로 게시 (GIL 하에서 원자적)
+        slot = self._slots[self._slot_index]
+        self._slot_index ^= 1
+        self._publish_seq += 1
+        slot['seq'] = self._publish_seq
+        slot['current'] = current
+        slot['total'] = total
+        slot['best_fitness'] = best_fitness
+        slot['current_layout'] = self._layout_ref
+        slot['layout_version'] = self._layout_version
+        slot['timestamp'] = time.time()
+        self._latest = slot
+        
+        # 최적화 루프가 메인 스레드를 점유하므로 게시할 때 GUI 이벤트 처리
+        # (타이머 콜백, 창 리사이즈, draw_idle 요청이 여기서 실행됨)
+        # GUI 오류(닫히는 중인 창 등)는 최적화 루프로 전파하지 않고 시각화만 중단
         try:
-            self.update_queue.put_nowait(update_data)
-        except queue.Full:
-            # 큐가 가득 차면 오래된 업데이트 제거
-            try:
-                self.update_queue.get_nowait()
-                self.update_queue.put_nowait(update_data)
-            except queue.Empty:
-                pass
-    
-    def _visualization_worker(self):
-        """시각화 워커 스레드"""
+            fig.canvas.flush_events()
+        except Exception as e:
+            print(f"⚠️ 시각화 이벤트 처리 오류: {str(e)}")
+            self._on_close(None)
+    
+    def _poll_and_draw(self):
+        """타이머 콜백: 슬롯의 최신 업데이트를 적용하고 다시 그리기"""
         
-        try:
-            # 시각화 창 설정
-            self.fig, self.axes = plt.subplots(2, 2, figsize=(14, 9))
-            self.fig.suptitle('공정 배치 최적화 실시간 모니터링', fontsize=14, fontweight='bold')
-            
-            # 초기 설정
-            self._setup_plots()
-            
-            plt.ion()  # 대화형 모드
-            plt.show(block=False)
-            
-            last_update_time = 0
-            
-            while self.is_active:
-                current_time = time.time()
-                
-                # 업데이트 간격 체크
-                if current_time - last_update_time < self.update_interval:
-                    time.sleep(0.1)
-                    continue
-                
-                # 큐에서 최신 업데이트 가져오기
-                latest_update = None
-                while not self.update_queue.empty():
-                    try:
-                        latest_update = self.update_queue.get_nowait()
-                    except queue.Empty:
-                        break
-                
-                if latest_update:
-                    self._apply_update(latest_update)
-                    self._update_visualization()
-                    last_update_time = current_time
-                
-                time.sleep(0.1)
+        # 슬롯은 재사용되므로 객체 대신 게시 번호로 비교 (같은 값은 다시 그리지 않음)
+        latest_update = self._latest
+        if latest_update is None or latest_update['seq'] == self._applied_seq:
+            return
         
-        except Exception as e:
-            print(f"⚠️ 시각화 워커 오류: {str(e)}")
-        finally:
-            try:
-                if hasattr(self, 'fig'):
-                    plt.close(self.fig)
-            except:
-                pass
+        self._applied_seq = latest_update['seq']
+        self._apply_update(latest_update)
+        self._update_visualization()
     
     def _setup_plots(self):
         """플롯 초기 설정"""
@@ -170,7 +280,7 @@ class RealtimeVisualizer:
         self.axes[0, 0].set_title('현재 최적 배치')
         self.axes[0, 1].set_title('적합도 진화')
         self.axes[1, 0].set_title('진행률')
-        self.axes[1, 1].set_title('통계')
+        self.axes[1, 1].set_title('최적화 통계')
         
         # 배치 플롯 설정
         ax_layout = self.axes[0, 0]
@@ -181,136 +291,266 @@ class RealtimeVisualizer:
         ax_layout.set_xlabel('X (m)')
         ax_layout.set_ylabel('Y (m)')
         
+        # 부지 경계 (정적 배경)
+        site_boundary = patches.Rectangle(
+            (0, 0), self.site_width, self.site_height,
+            linewidth=2, edgecolor='black', facecolor='none'
+        )
+        ax_layout.add_patch(site_boundary)
+        
+        # 공정 사각형 컬렉션/라벨 아티스트 캐시 (프레임마다 재사용, blitting 사용 시 blitting으로만 그림)
+        animated = self.USE_BLIT
+        self._rects_coll = PolyCollection([], edgecolors='black', linewidths=1, alpha=0.7, animated=animated)
+        ax_layout.add_collection(self._rects_coll, autolim=False)
+        self._layout_labels = [self._create_label(ax_layout, animated) for _ in range(self.MAX_LABELS)]
+        self._labels_shown = 0
+        
         # 적합도 플롯 설정
         ax_fitness = self.axes[0, 1]
         ax_fitness.grid(True, alpha=0.3)
         ax_fitness.set_xlabel('평가 횟수')
         ax_fitness.set_ylabel('적합도')
         
-        plt.tight_layout()
+        # 적합도 곡선/최고값 선 (영구 아티스트, set_data로만 갱신)
+        self._fit_line, = ax_fitness.plot([], [], 'b-', linewidth=2, animated=animated)
+        self._fit_hline = ax_fitness.axhline(0, color='r', linestyle='--', alpha=0.7, 
+                                             animated=animated, visible=False)
+        
+        # 진행률 막대/텍스트 (영구 아티스트, set_width/set_text로만 갱신)
+        ax_progress = self.axes[1, 0]
+        ax_progress.set_xlim(0, 100)
+        ax_progress.set_xlabel('진행률 (%)')
+        self._prog_bar = ax_progress.barh(['Progress'], [0], color='green', alpha=0.7)[0]
+        self._prog_bar.set_animated(animated)
+        self._prog_text = ax_progress.text(0, 0, '', ha='center', va='center', 
+                                           fontweight='bold', color='white', animated=animated)
+        
+        # 통계 텍스트 (영구 아티스트, set_text로만 갱신)
+        ax_stats = self.axes[1, 1]
+        ax_stats.axis('off')
+        self._stats_text = ax_stats.text(0.1, 0.5, '', transform=ax_stats.transAxes, 
+                                         fontsize=12, verticalalignment='center', animated=animated,
+                                         bbox=dict(boxstyle="round,pad=0.3", facecolor='lightgray', alpha=0.5))
+        
+        # 영역별 blitting 대상 아티스트 그룹 (그리는 순서대로)과 캐시된 배경
+        self._animated = {
+            ax_layout: ([self._rects_coll], self._layout_labels),
+            ax_fitness: ([self._fit_line, self._fit_hline],),
+            ax_progress: ([self._prog_bar, self._prog_text],),
+            ax_stats: ([self._stats_text],)
+        }
+        self._backgrounds = {}
+        if animated:
+            self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+            self.fig.canvas.mpl_connect('resize_event', self._on_resize)
+        
+        self.fig.tight_layout()
     
     def _apply_update(self, update_data):
-        """업데이트 데이터 적용"""
+        """업데이트 데이터 적용 (이전 값과 비교해 바뀐 영역만 변경 표시)"""
+        
+        dirty = self._dirty
+        is_final = update_data['current'] >= update_data['total']
+        dirty['progress'] |= (update_data['current'] != self.progress_data['current'] or 
+                              update_data['total'] != self.progress_data['total'])
+        # 정체 구간에서는 적합도 그래프를 다시 그리지 않음 (기록은 계속 쌓이고 개선/마지막 업데이트 때 반영)
+        dirty['fitness'] |= (update_data['best_fitness'] != self.progress_data['best_fitness'] or 
+                             self._fit_count == 0 or is_final)
+        dirty['layout'] |= update_data['layout_version'] != self._applied_layout_version
+        dirty['stats'] |= dirty['progress'] or dirty['fitness'] or dirty['layout']
         
         self.progress_data['current'] = update_data['current']
         self.progress_data['total'] = update_data['total']
         self.progress_data['best_fitness'] = update_data['best_fitness']
-        self.progress_data['fitness_history'].append(update_data['best_fitness'])
         
-        if update_data['current_layout']:
+        # 링 버퍼에 O(1) 추가
+        self._fit[self._fit_count % len(self._fit)] = update_data['best_fitness']
+        self._fit_count += 1
+        self._best = max(self._best, update_data['best_fitness'])
+        
+        # 배치가 바뀐 경우에만 SoA 배열로 변환 (호출자의 딕셔너리는 수정하지 않음)
+        if update_data['layout_version'] != self._applied_layout_version:
             self.current_layout = update_data['current_layout']
+            self._applied_layout_version = update_data['layout_version']
+            self._ingest_layout(self.current_layout)
+    
+    def _ingest_layout(self, layout: List[Dict[str, Any]]):
+        """배치 목록을 좌표/크기/색상 인덱스 배열과 라벨 문자열 목록으로 변환"""
+        count = len(layout)
+        self._xs = np.fromiter((rect['x'] for rect in layout), dtype=np.float32, count=count)
+        self._ys = np.fromiter((rect['y'] for rect in layout), dtype=np.float32, count=count)
+        self._ws = np.fromiter((rect['width'] for rect in layout), dtype=np.float32, count=count)
+        self._hs = np.fromiter((rect['height'] for rect in layout), dtype=np.float32, count=count)
+        
+        color_index = self.COLOR_INDEX
+        self._color_idx = np.fromiter(
+            (color_index.get(rect.get('building_type', 'sub'), self.DEFAULT_COLOR_INDEX) for rect in layout),
+            dtype=np.uint8, count=count
+        )
+        self._label_texts = [f"{rect['id']} (R)" if rect.get('rotated', False) else str(rect['id']) 
+                             for rect in layout]
     
     def _update_visualization(self):
-        """시각화 업데이트"""
+        """시각화 업데이트 (변경 표시된 영역만)"""
+        
+        dirty = self._dirty
+        if not any(dirty.values()):
+            return
         
         try:
-            # 1. 현재 배치
-            self._update_layout_plot()
-            
-            # 2. 적합도 진화
-            self._update_fitness_plot()
-            
-            # 3. 진행률
-            self._update_progress_plot()
-            
-            # 4. 통계
-            self._update_statistics_plot()
-            
-            # 화면 업데이트
-            self.fig.canvas.draw_idle()  # draw() 대신 draw_idle() 사용
-            self.fig.canvas.start_event_loop(0.01)  # 짧은 이벤트 루프
+            # 각 영역은 blitting으로 갱신되고, 전체 렌더링은 블록 종료 시 필요할 때만 한 번 요청
+            with _deferred_draw(self.fig):
+                # 1. 현재 배치
+                if dirty['layout']:
+                    self._update_layout_plot()
+                
+                # 2. 적합도 진화
+                if dirty['fitness']:
+                    self._update_fitness_plot()
+                
+                # 3. 진행률
+                if dirty['progress']:
+                    self._update_progress_plot()
+                
+                # 4. 통계
+                if dirty['stats']:
+                    self._update_statistics_plot()
             
         except Exception as e:
             print(f"⚠️ 시각화 업데이트 오류: {str(e)}")
+        
+        finally:
+            for key in dirty:
+                dirty[key] = False
     
     def _update_layout_plot(self):
-        """배치 플롯 업데이트"""
+        """배치 플롯 업데이트 (캐시된 아티스트 갱신 후 blitting)"""
         
         ax = self.axes[0, 0]
-        ax.clear()
-        ax.set_title(f'현재 최적 배치 (진행률: {self.progress_data["current"]}/{self.progress_data["total"]})')
-        ax.set_xlim(0, self.site_width)
-        ax.set_ylim(0, self.site_height)
-        ax.set_aspect('equal')
-        ax.grid(True, alpha=0.3)
-        ax.set_xlabel('X (m)')
-        ax.set_ylabel('Y (m)')
-        
-        # 부지 경계
-        site_boundary = patches.Rectangle(
-            (0, 0), self.site_width, self.site_height,
-            linewidth=2, edgecolor='black', facecolor='none'
-        )
-        ax.add_patch(site_boundary)
         
-        # 공정들 표시
-        for rect in self.current_layout:
-            building_type = rect.get('building_type', 'sub')
-            color = self.process_colors.get(building_type, '#CCCCCC')
-            
-            rectangle = patches.Rectangle(
-                (rect['x'], rect['y']), 
-                rect['width'], 
-                rect['height'],
-                linewidth=1,
-                edgecolor='black',
-                facecolor=color,
-                alpha=0.7
-            )
-            ax.add_patch(rectangle)
-            
-            # 라벨
-            center_x = rect['x'] + rect['width'] / 2
-            center_y = rect['y'] + rect['height'] / 2
-            rotation_marker = " (R)" if rect.get('rotated', False) else ""
-            label = f"{rect['id']}{rotation_marker}"
-            
-            ax.text(center_x, center_y, label, 
-                   ha='center', va='center', 
-                   fontsize=8, fontweight='bold',
-                   bbox=dict(boxstyle="round,pad=0.1", facecolor='white', alpha=0.8))
+        xs, ys, ws, hs = self._xs, self._ys, self._ws, self._hs
+        count = len(xs)
+        
+        # 공정 사각형: (N, 4, 2) 꼭짓점 배열을 브로드캐스팅으로 한 번에 구성 (Agg 그리기 호출 1회)
+        verts = np.empty((count, 4, 2), dtype=np.float32)
+        verts[:, 0, 0] = xs
+        verts[:, 0, 1] = ys
+        verts[:, 1, 0] = xs + ws
+        verts[:, 1, 1] = ys
+        verts[:, 2, 0] = verts[:, 1, 0]
+        verts[:, 2, 1] = ys + hs
+        verts[:, 3, 0] = xs
+        verts[:, 3, 1] = verts[:, 2, 1]
+        self._rects_coll.set_verts(verts)
+        self._rects_coll.set_facecolors(self._colors_rgba[self._color_idx])
+        
+        # 라벨 풀이 부족할 때만 추가 생성
+        while len(self._layout_labels) < count:
+            self._layout_labels.append(self._create_label(ax, self.USE_BLIT))
+        
+        # 라벨 표시 (중심 좌표는 배열 연산으로 한 번에 계산)
+        centers = zip((xs + ws * 0.5).tolist(), (ys + hs * 0.5).tolist())
+        for center, text, label in zip(centers, self._label_texts, self._layout_labels):
+            label.set_position(center)
+            label.set_text(text)
+            label.set_visible(True)
+        
+        # 이전 프레임에 보였던 라벨 중 남는 것만 숨김
+        for label in self._layout_labels[count:self._labels_shown]:
+            label.set_visible(False)
+        self._labels_shown = count
+        
+        self._blit(ax)
+    
+    @staticmethod
+    def _create_label(ax, animated: bool = True):
+        """숨겨진 상태의 공정 라벨 Text 아티스트 생성 (animated면 blitting으로만 그림)"""
+        return ax.text(0, 0, '', 
+                       ha='center', va='center', 
+                       fontsize=8, fontweight='bold', clip_on=True, animated=animated, visible=False,
+                       bbox=dict(boxstyle="round,pad=0.1", facecolor='white', alpha=0.8))
+    
+    def _draw_animated(self, ax, renderer):
+        """영역의 보이는 blitting 대상 아티스트만 그리기"""
+        for group in self._animated[ax]:
+            for artist in group:
+                if artist.get_visible():
+                    artist.draw(renderer)
+    
+    def _blit(self, ax):
+        """캐시된 배경을 복원하고 해당 영역의 아티스트만 다시 그려 그 영역만 갱신"""
+        background = self._backgrounds.get(ax)
+        if background is None or self.fig.stale:
+            return  # 전체 렌더링 대기 중 (draw_event에서 새 배경 위에 그려짐)
+        
+        canvas = self.fig.canvas
+        canvas.restore_region(background)
+        self._draw_animated(ax, canvas.get_renderer())
+        canvas.blit(ax.bbox)
+    
+    def _on_resize(self, event):
+        """창 크기가 바뀌면 이전 크기의 배경을 폐기 (다음 전체 렌더링에서 다시 캐시)"""
+        self._backgrounds.clear()
+    
+    def _on_draw(self, event):
+        """전체 렌더링(초기/리사이즈/draw_idle) 후 배경을 다시 캐시하고 아티스트를 얹음"""
+        # 파일 저장(다른 DPI/PDF·SVG 캔버스) 중에는 아티스트만 그리고 화면용 배경은 캐시하지 않음
+        canvas = event.canvas
+        cache_background = not canvas.is_saving() and self.fig is not None and canvas is self.fig.canvas
+        for ax in self._animated:
+            if cache_background:
+                self._backgrounds[ax] = canvas.copy_from_bbox(ax.bbox)
+            self._draw_animated(ax, event.renderer)
     
     def _update_fitness_plot(self):
-        """적합도 플롯 업데이트"""
+        """적합도 플롯 업데이트 (영구 Line2D 갱신)"""
         
         ax = self.axes[0, 1]
-        ax.clear()
-        ax.set_title('적합도 진화')
-        ax.grid(True, alpha=0.3)
-        ax.set_xlabel('평가 횟수')
-        ax.set_ylabel('적합도')
+        if not self._fit_count:
+            return
+        
+        xs, ys = self._fitness_series()
+        self._fit_line.set_data(xs, ys)
+        self._fit_hline.set_ydata([self._best, self._best])
+        self._fit_hline.set_visible(True)
         
-        if self.progress_data['fitness_history']:
-            ax.plot(self.progress_data['fitness_history'], 'b-', linewidth=2)
-            ax.axhline(y=max(self.progress_data['fitness_history']), color='r', linestyle='--', alpha=0.7)
+        limits = (ax.get_xlim(), ax.get_ylim())
+        ax.relim(visible_only=True)
+        ax.autoscale_view()
+        
+        # 축 범위가 바뀌면 그림이 stale 상태가 되어 _deferred_draw가 눈금까지 전체 렌더링 (배경 재캐시)
+        if (ax.get_xlim(), ax.get_ylim()) == limits:
+            self._blit(ax)
+    
+    def _fitness_series(self):
+        """링 버퍼의 적합도 기록을 시간 순서의 (x, y) 배열로 반환 (최근 FITNESS_HISTORY_SIZE개)"""
+        size = len(self._fit)
+        if self._fit_count <= size:
+            ys = self._fit[:self._fit_count]
+        else:
+            head = self._fit_count % size
+            ys = np.concatenate([self._fit[head:], self._fit[:head]])
+        xs = np.arange(self._fit_count - len(ys), self._fit_count)
+        return xs, ys
     
     def _update_progress_plot(self):
-        """진행률 플롯 업데이트"""
-        
-        ax = self.axes[1, 0]
-        ax.clear()
-        ax.set_title('진행률')
+        """진행률 플롯 업데이트 (영구 막대/텍스트 갱신)"""
         
         current = self.progress_data['current']
         total = self.progress_data['total']
         
         if total > 0:
             progress = current / total * 100
-            ax.barh(['Progress'], [progress], color='green', alpha=0.7)
-            ax.set_xlim(0, 100)
-            ax.set_xlabel('진행률 (%)')
+            self._prog_bar.set_width(progress)
             
             # 텍스트 표시
-            ax.text(progress/2, 0, f'{progress:.1f}%', 
-                   ha='center', va='center', fontweight='bold', color='white')
+            self._prog_text.set_x(progress / 2)
+            self._prog_text.set_text(f'{progress:.1f}%')
+            
+            self._blit(self.axes[1, 0])
     
     def _update_statistics_plot(self):
-        """통계 플롯 업데이트"""
-        
-        ax = self.axes[1, 1]
-        ax.clear()
-        ax.set_title('최적화 통계')
-        ax.axis('off')
+        """통계 플롯 업데이트 (영구 텍스트 갱신)"""
         
         # 텍스트 통계
         if self.progress_data['start_time']:
@@ -321,14 +561,13 @@ class RealtimeVisualizer:
         
         stats_text = f"""
 소요 시간: {elapsed_str}
-평가된 솔루션: {self.progress_data['current']}
+평가된 솔루션: {self.progress_data['current']}/{self.progress_data['total']}
 최고 적합도: {self.progress_data['best_fitness']:.2f}
 배치된 공정: {len(self.current_layout)}개
         """.strip()
         
-        ax.text(0.1, 0.5, stats_text, transform=ax.transAxes, 
-               fontsize=12, verticalalignment='center',
-               bbox=dict(boxstyle="round,pad=0.3", facecolor='lightgray', alpha=0.5))
+        self._stats_text.set_text(stats_text)
+        self._blit(self.axes[1, 1])
 
 
 class SimpleConsoleVisualizer:
@@ -337,21 +576,95 @@ class SimpleConsoleVisualizer:
     def __init__(self, site_width: int, site_height: int):
         self.site_width = site_width
         self.site_height = site_height
-        self.last_progress = -1
+        
+        # 다음 출력 기준 평가 횟수 (10% 간격, 첫 total을 받을 때 간격 결정)
+        self._next_threshold = 0
+        self._step = None
         print(f"📺 콘솔 시각화기 초기화: {site_width}×{site_height}m")
     
     def start_optimization(self):
+        self._next_threshold = 0
+        self._step = None
         print("📺 콘솔 시각화 시작")
         
     def stop_optimization(self):
         print("📺 콘솔 시각화 종료")
     
     def update_progress(self, current, total, best_fitness, current_layout=None):
-        if total > 0:
-            progress = int(current / total * 100)
-            if progress != self.last_progress and progress % 10 == 0:
-                print(f"   📊 진행률: {progress}% - 최고 적합도: {best_fitness:.2f}")
-                self.last_progress = progress
+        # 기준 미만이면 정수 비교 한 번으로 반환
+        if current < self._next_threshold or total <= 0:
+            return
+        
+        if self._step is None:
+            self._step = max(1, total // 10)
+        
+        progress = int(current / total * 100)
+        print(f"   📊 진행률: {progress}% - 최고 적합도: {best_fitness:.2f}")
+        self._next_threshold = (current // self._step + 1) * self._step
+
+
+class HeadlessPNGVisualizer(RealtimeVisualizer):
+    """
+    GUI 없는 환경용 시각화기
+    
+    GUI 백엔드/이벤트 루프 없이 전용 Agg 캔버스에 같은 2×2 대시보드를 그리고,
+    update_interval마다 PNG 파일 하나를 덮어써서 진행 상황을 남깁니다.
+    """
+    
+    USE_BLIT = False
+    
+    def __init__(self, site_width: int, site_height: int, update_interval: float = 1.0,
+                 output_path: str = 'optimization_progress.png'):
+        """
+        초기화
+        
+        Args:
+            site_width: 부지 너비
+            site_height: 부지 높이
+            update_interval: PNG 저장 간격 (초)
+            output_path: 저장할 PNG 파일 경로 (매번 덮어씀)
+        """
+        super().__init__(site_width, site_height, update_interval)
+        self.output_path = output_path
+    
+    def start_optimization(self):
+        """최적화 시각화 시작 (pyplot을 거치지 않는 전용 Agg 그림 생성)"""
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        self._reset_state()
+        
+        self.fig = Figure(figsize=(14, 9))
+        FigureCanvasAgg(self.fig)
+        self.axes = self.fig.subplots(2, 2)
+        self.fig.suptitle('공정 배치 최적화 실시간 모니터링', fontsize=14, fontweight='bold')
+        self._setup_plots()
+        
+        self.is_active = True
+        print(f"📺 헤드리스 PNG 시각화 시작: {self.output_path}")
+    
+    def stop_optimization(self):
+        """최적화 시각화 종료"""
+        self.is_active = False
+        self.fig = None
+        print("📺 헤드리스 PNG 시각화 종료")
+    
+    def update_progress(self, 
+                       current: int, 
+                       total: int, 
+                       best_fitness: float, 
+                       current_layout: List[Dict[str, Any]] = None):
+        """진행 상황 업데이트 (게시된 경우에만 그 자리에서 그리고 PNG 저장)"""
+        published_seq = self._publish_seq
+        super().update_progress(current, total, best_fitness, current_layout)
+        if self._publish_seq == published_seq:
+            return  # 저장 간격 미경과
+        
+        self._poll_and_draw()
+        try:
+            self.fig.savefig(self.output_path)
+        except Exception as e:
+            print(f"⚠️ PNG 저장 오류: {str(e)}")
 
 
 # 환경에 맞는 시각화기 자동 선택 함수
@@ -361,14 +674,19 @@ def create_visualizer(site_width: int, site_height: int, use_gui: bool = True):
     if not use_gui:
         return SimpleConsoleVisualizer(site_width, site_height)
     
+    # 디스플레이가 없는 환경(헤드리스 서버/CI)에서는 GUI 백엔드를 초기화하지 않고 PNG로 저장
+    if sys.platform.startswith('linux') and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')):
+        print("⚠️ 디스플레이가 없습니다. 헤드리스 PNG 시각화기를 사용합니다.")
+        return HeadlessPNGVisualizer(site_width, site_height)
+    
     try:
-        # matplotlib 사용 가능 여부 확인
-        import matplotlib
+        # GUI 백엔드 선택 (macOS 등 블로킹 백엔드 대신 TkAgg, 이미 다른 백엔드가 동작 중이면 유지)
+        matplotlib.use('TkAgg', force=False)
         backend = matplotlib.get_backend()
         
         if backend.lower() in ['agg', 'svg', 'pdf', 'ps']:
-            print("⚠️ GUI 백엔드가 아닙니다. 콘솔 시각화기를 사용합니다.")
-            return SimpleConsoleVisualizer(site_width, site_height)
+            print("⚠️ GUI 백엔드가 아닙니다. 헤드리스 PNG 시각화기를 사용합니다.")
+            return HeadlessPNGVisualizer(site_width, site_height)
         
         return RealtimeVisualizer(site_width, site_height)
         
@@ -5,15 +5,95 @@
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+import matplotlib.patheffects as pe
+from matplotlib.collections import PatchCollection, LineCollection
 from matplotlib.widgets import Button
+from matplotlib.colors import to_rgba
+from matplotlib.transforms import Bbox, TransformedBbox
 import numpy as np
 from typing import Dict, List, Any, Optional
+import json
+import sys
 import time
 
+# orjson (선택적) - 없으면 표준 json 모듈 사용
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 공정 라벨 외곽선 효과 (라벨마다 배경 상자 패치를 만드는 bbox 대체)
+LABEL_PATH_EFFECTS = [pe.withStroke(linewidth=2, foreground='white')]
+SIZE_LABEL_PATH_EFFECTS = [pe.withStroke(linewidth=2, foreground='yellow')]
+
+# JSON으로 저장하는 공정 필드와 기본값
+LAYOUT_EXPORT_FIELDS = (
+    ('id', None), ('x', None), ('y', None), ('width', None), ('height', None),
+    ('rotated', False), ('building_type', 'sub')
+)
+
+
+def _compute_stats(solution: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    솔루션 배치 통계 계산 (솔루션 딕셔너리의 '_stats'에 캐시)
+    
+    배치 좌표/크기를 한 번에 배열로 모아 면적 합계와 배치 범위를 계산하고,
+    공정 유형/회전 수를 함께 집계합니다. 이후 호출은 캐시된 값을 그대로 반환합니다.
+    
+    Args:
+        solution: 'layout' 키를 가진 솔루션 딕셔너리
+        
+    Returns:
+        통계 딕셔너리 (processes, main, sub, rotated, total_area, min_x, max_x, min_y, max_y,
+        layout_width, layout_height)
+    """
+    stats = solution.get('_stats')
+    if stats is not None:
+        return stats
+    
+    layout = solution['layout']
+    if layout:
+        geometry = np.array([(r['x'], r['y'], r['width'], r['height']) for r in layout], dtype=np.float64)
+        x, y, w, h = geometry.T
+        total_area = float((w * h).sum())
+        min_x, max_x = float(x.min()), float((x + w).max())
+        min_y, max_y = float(y.min()), float((y + h).max())
+    else:
+        total_area = min_x = max_x = min_y = max_y = 0.0
+    
+    building_types = [r.get('building_type') for r in layout]
+    stats = {
+        'processes': len(layout),
+        'main': building_types.count('main'),
+        'sub': building_types.count('sub'),
+        'rotated': sum(1 for r in layout if r.get('rotated', False)),
+        'total_area': total_area,
+        'min_x': min_x,
+        'max_x': max_x,
+        'min_y': min_y,
+        'max_y': max_y,
+        'layout_width': max_x - min_x,
+        'layout_height': max_y - min_y
+    }
+    solution['_stats'] = stats
+    return stats
+
 
 class ResultVisualizer:
     """최적화 결과 시각화기"""
     
+    # 통계 비교 표 머리글 (고정 문자열이므로 클래스 정의 시 한 번만 생성)
+    COMPARISON_HEADER = f"{'항목':<15} {'솔루션 #1':<12} {'솔루션 #2':<12} {'차이':<10}\n{'-'*50}"
+    
+    # 인접성 히트맵 최대 칸 수 (공정이 더 많으면 연속 공정 묶음으로 축소)
+    ADJACENCY_MAX_CELLS = 40
+    
+    # 창별 고정 여백 (tight_layout의 반복 측정 대신 사용하는 subplots_adjust 인자)
+    RESULT_WINDOW_MARGINS = dict(left=0.04, right=0.98, top=0.90, bottom=0.15, wspace=0.25, hspace=0.3)
+    DETAIL_VIEW_MARGINS = dict(left=0.05, right=0.98, top=0.93, bottom=0.08, wspace=0.15, hspace=0.2)
+    COMPARISON_VIEW_MARGINS = dict(left=0.05, right=0.98, top=0.92, bottom=0.12, wspace=0.1, hspace=0.25)
+    
     def __init__(self, site_width: int, site_height: int):
         """
         초기화
@@ -31,10 +111,29 @@ class ResultVisualizer:
             'sub': '#4ECDC4',       # 청록 계열 (부공정)
             'fixed': '#95A5A6'      # 회색 (고정구역)
         }
+        # 유형별 RGBA 색상 (공정마다 16진수 색상 문자열을 해석하지 않도록 미리 변환)
+        self._color_by_type = {key: to_rgba(value) for key, value in self.process_colors.items()}
+        self._default_color = to_rgba('#CCCCCC')
         
         # 현재 표시 중인 솔루션들
         self.solutions = []
         self.current_detail_index = 0
+        self.result_fig = None
+        self._result_panel = None
+        
+        # 열려 있는 상세/비교 보기 창 캐시 (버튼을 다시 누르면 새로 그리지 않고 재사용, 창을 닫으면 제거)
+        self._view_figures = {}
+        
+        # 비교 창의 배치 축/컬렉션과 현재 비교 중인 솔루션 쌍 (비교 대상이 바뀌면 제자리 갱신)
+        self._comparison_axes = None
+        self._comparison_colls = ()
+        self._comparison_pair = None
+        
+        # 상세 보기 창의 축/제목/인접성 컬러바와 현재 표시 중인 솔루션 (솔루션이 바뀌면 제자리 갱신)
+        self._detail_axes = None
+        self._detail_title = None
+        self._adjacency_colorbar = None
+        self._detail_solution = None
         
         print(f"📊 결과 시각화기 초기화: {site_width}×{site_height}mm")
     
@@ -50,11 +149,16 @@ class ResultVisualizer:
             return
         
         self.solutions = solutions
+        self.current_detail_index = 0
         
         # 상위 4개와 나머지로 분리
         top_4 = solutions[:4]
         remaining = solutions[4:8] if len(solutions) > 4 else []
         
+        # 표시할 솔루션의 배치 통계를 창 생성 전에 미리 계산 (솔루션별 캐시, 패널 그리기 중에는 조회만)
+        for solution in top_4 + remaining:
+            _compute_stats(solution)
+        
         print(f"📊 {len(solutions)}개 솔루션 시각화 시작")
         print(f"   상위 4개: 큰 화면으로 표시")
         print(f"   나머지 {len(remaining)}개: 작은 화면으로 표시")
@@ -68,83 +172,85 @@ class ResultVisualizer:
         # 창 크기 설정 (가로로 긴 형태)
         fig = plt.figure(figsize=(20, 12))
         fig.suptitle('🏆 공정 배치 최적화 결과', fontsize=20, fontweight='bold', y=0.95)
+        self.result_fig = fig
         
-        # 상위 4개 솔루션 (2x2 그리드)
+        # 2x4 패널 그리드를 한 번에 생성
+        grid_axes = fig.subplots(2, 4).ravel()
+        
+        # 솔루션 패널 축 (클릭 시 상세 정보 패널의 솔루션 선택에 사용)
+        layout_axes = []
+        
+        # 상위 4개 솔루션 (윗줄)
         for i, solution in enumerate(top_4):
-            ax = plt.subplot(2, 4, i + 1)
+            ax = grid_axes[i]
             self._draw_layout(ax, solution, title=f"#{i+1}: {solution['fitness']:.1f}점", large=True)
+            layout_axes.append(ax)
+        
+        # 나머지 솔루션들 (아랫줄에 작게)
+        for i, solution in enumerate(remaining[:4]):  # 최대 4개 더 표시
+            ax = grid_axes[i + 4]
+            self._draw_layout(ax, solution, title=f"#{i+5}: {solution['fitness']:.1f}점", large=False)
+            layout_axes.append(ax)
         
-        # 나머지 솔루션들 (세로로 작게)
-        if remaining:
-            for i, solution in enumerate(remaining[:4]):  # 최대 4개 더 표시
-                ax = plt.subplot(2, 4, i + 5)
-                self._draw_layout(ax, solution, title=f"#{i+5}: {solution['fitness']:.1f}점", large=False)
+        # 솔루션이 없는 칸은 제거
+        for ax in grid_axes:
+            if ax not in layout_axes:
+                ax.remove()
         
         # 상세 정보 표시 영역 추가
-        self._add_detail_panel(fig)
+        panel = self._add_detail_panel(fig, layout_axes)
         
-        # 버튼 추가
-        self._add_control_buttons(fig)
+        # 버튼 추가 (Button 위젯은 캔버스에 약한 참조로만 연결되므로 창의 패널 상태에 보관)
+        panel['buttons'] = self._add_control_buttons(fig)
+        self._result_panel = panel
         
-        plt.tight_layout()
-        plt.subplots_adjust(top=0.90, bottom=0.05)
+        # 고정 격자이므로 tight_layout 측정 대신 여백을 직접 지정 (하단은 상세 패널/버튼 영역)
+        fig.subplots_adjust(**self.RESULT_WINDOW_MARGINS)
         plt.show()
     
     def _draw_layout(self, ax, solution: Dict[str, Any], title: str, large: bool = True):
-        """개별 배치 그리기"""
+        """
+        개별 배치 그리기
+        
+        Returns:
+            공정 사각형 PatchCollection (배치를 바꿀 때 set_paths/set_facecolors로 재사용)
+        """
         
         layout = solution['layout']
+        site_width, site_height = self.site_width, self.site_height
         
-        # 축 설정
-        ax.set_xlim(0, self.site_width)
-        ax.set_ylim(0, self.site_height)
+        # 축 설정 (범위는 부지 크기로 고정, 자동 범위 계산 끔)
+        ax.set_xlim(0, site_width)
+        ax.set_ylim(0, site_height)
+        ax.set_autoscale_on(False)
         ax.set_aspect('equal')
         ax.set_title(title, fontsize=12 if large else 10, fontweight='bold')
         
         if large:
-            ax.grid(True, alpha=0.3)
+            ax.add_collection(self._layout_grid(ax), autolim=False)
             ax.set_xlabel('X (mm)', fontsize=10)
             ax.set_ylabel('Y (mm)', fontsize=10)
         else:
-            ax.grid(True, alpha=0.2)
-            ax.tick_params(labelsize=8)
+            # 썸네일은 눈금/격자 없이 표시
+            ax.grid(False)
+            ax.set_xticks([])
+            ax.set_yticks([])
         
         # 부지 경계
         site_boundary = patches.Rectangle(
-            (0, 0), self.site_width, self.site_height,
+            (0, 0), site_width, site_height,
             linewidth=2, edgecolor='black', facecolor='none'
         )
         ax.add_patch(site_boundary)
         
-        # 공정들 그리기
-        for rect in layout:
-            building_type = rect.get('building_type', 'sub')
-            color = self.process_colors.get(building_type, '#CCCCCC')
-            
-            # 사각형
-            rectangle = patches.Rectangle(
-                (rect['x'], rect['y']), 
-                rect['width'], 
-                rect['height'],
-                linewidth=1,
-                edgecolor='black',
-                facecolor=color,
-                alpha=0.8
-            )
-            ax.add_patch(rectangle)
-            
-            # 라벨 (큰 화면에만)
-            if large:
-                center_x = rect['x'] + rect['width'] / 2
-                center_y = rect['y'] + rect['height'] / 2
-                
-                rotation_marker = "↻" if rect.get('rotated', False) else ""
-                label = f"{rect['id']}{rotation_marker}"
-                
-                ax.text(center_x, center_y, label, 
-                       ha='center', va='center', 
-                       fontsize=9, fontweight='bold',
-                       bbox=dict(boxstyle="round,pad=0.1", facecolor='white', alpha=0.9))
+        # 공정들 그리기 (사각형 전체를 하나의 컬렉션으로 추가, 데이터 범위 갱신 생략)
+        rects, facecolors = self._layout_patches(layout)
+        rectangles = PatchCollection(rects, facecolors=facecolors, edgecolors='black', linewidths=1, alpha=0.8)
+        ax.add_collection(rectangles, autolim=False)
+        
+        # 라벨 (큰 화면에만)
+        if large:
+            self._draw_layout_labels(ax, layout)
         
         # 메타 정보 표시 (작은 화면용)
         if not large:
@@ -155,25 +261,116 @@ class ResultVisualizer:
             ax.text(0.02, 0.98, info_text, transform=ax.transAxes,
                    fontsize=7, verticalalignment='top',
                    bbox=dict(boxstyle="round,pad=0.3", facecolor='white', alpha=0.8))
+        
+        return rectangles
     
-    def _add_detail_panel(self, fig):
-        """상세 정보 패널 추가"""
+    def _layout_grid(self, ax):
+        """
+        부지 격자선 LineCollection (눈금마다 격자선 아티스트를 만드는 ax.grid 대체)
+        
+        Args:
+            ax: 범위가 부지 크기로 설정된 축
+        
+        Returns:
+            현재 눈금 위치의 수직/수평 격자선을 하나로 담은 LineCollection
+        """
+        xs = [x for x in ax.get_xticks() if 0 <= x <= self.site_width]
+        ys = [y for y in ax.get_yticks() if 0 <= y <= self.site_height]
+        segments = ([[(x, 0), (x, self.site_height)] for x in xs] + 
+                    [[(0, y), (self.site_width, y)] for y in ys])
+        
+        return LineCollection(segments, colors=plt.rcParams['grid.color'], 
+                              linewidths=plt.rcParams['grid.linewidth'], alpha=0.3, zorder=1.5)
+    
+    def _layout_patches(self, layout: List[Dict[str, Any]]):
+        """배치의 공정 사각형 패치 목록과 면 색상 목록"""
+        color_by_type, default_color = self._color_by_type, self._default_color
+        Rectangle = patches.Rectangle
+        rects = [Rectangle((rect['x'], rect['y']), rect['width'], rect['height']) for rect in layout]
+        facecolors = [color_by_type.get(rect.get('building_type', 'sub'), default_color) for rect in layout]
+        return rects, facecolors
+    
+    def _draw_layout_labels(self, ax, layout: List[Dict[str, Any]]):
+        """공정 라벨 그리기 (큰 화면용)"""
+        for rect in layout:
+            center_x = rect['x'] + rect['width'] / 2
+            center_y = rect['y'] + rect['height'] / 2
+            
+            rotation_marker = "↻" if rect.get('rotated', False) else ""
+            label = f"{rect['id']}{rotation_marker}"
+            
+            ax.text(center_x, center_y, label, 
+                   ha='center', va='center', 
+                   fontsize=9, fontweight='bold',
+                   path_effects=LABEL_PATH_EFFECTS)
+    
+    def _add_detail_panel(self, fig, layout_axes: List[Any]):
+        """
+        상세 정보 패널 추가
+        
+        패널 상태(텍스트, 캐시된 배경, 솔루션 패널 축)는 창마다 따로 두고 그 창의 이벤트 핸들러에만
+        연결하므로, 결과 창이 여러 개 열려 있어도 서로의 배경/텍스트를 건드리지 않습니다.
+        
+        Args:
+            fig: 결과 창 그림
+            layout_axes: 솔루션 패널 축 목록 (솔루션 순서)
+        
+        Returns:
+            창의 상세 패널 상태 딕셔너리
+        """
         
         # 하단에 상세 정보 텍스트 영역 생성
         detail_ax = fig.add_axes([0.05, 0.02, 0.7, 0.08])  # [left, bottom, width, height]
         detail_ax.axis('off')
         
+        # 상세 정보 텍스트 (솔루션을 바꿀 때 배치 패널은 다시 그리지 않고 blitting으로만 갱신)
+        text = detail_ax.text(0, 0.5, '', transform=detail_ax.transAxes,
+                              fontsize=11, verticalalignment='center', animated=True,
+                              bbox=dict(boxstyle="round,pad=0.5", facecolor='lightblue', alpha=0.3))
+        
+        # blitting 영역: 버튼 왼쪽의 하단 띠 (텍스트 상자가 축 밖으로 조금 나가도 포함, 창 크기를 따라감)
+        region = TransformedBbox(Bbox([[0.0, 0.0], [0.8, 0.12]]), fig.transFigure)
+        
+        panel = {'ax': detail_ax, 'text': text, 'region': region, 'background': None,
+                 'layout_axes': layout_axes, 'solutions': self.solutions}
+        fig.canvas.mpl_connect('draw_event', lambda event: self._on_draw(event, panel))
+        fig.canvas.mpl_connect('resize_event', lambda event: self._on_resize(event, panel))
+        fig.canvas.mpl_connect('button_press_event', lambda event: self._on_layout_click(event, panel))
+        
+        self.detail_ax = detail_ax
+        
         # 첫 번째 솔루션의 상세 정보 표시
         if self.solutions:
-            self._update_detail_panel(detail_ax, self.solutions[0])
+            self._update_detail_panel(panel, self.solutions[0])
         
-        self.detail_ax = detail_ax
+        return panel
+    
+    def _on_draw(self, event, panel: Dict[str, Any]):
+        """전체 렌더링 후 상세 패널 영역의 배경을 캐시하고 상세 정보 텍스트를 얹음"""
+        # 파일 저장(다른 DPI/PDF·SVG 캔버스) 중에는 텍스트만 그리고 화면용 배경은 캐시하지 않음
+        canvas = event.canvas
+        if not canvas.is_saving() and canvas is panel['ax'].figure.canvas:
+            panel['background'] = canvas.copy_from_bbox(panel['region'])
+        panel['text'].draw(event.renderer)
     
-    def _update_detail_panel(self, ax, solution: Dict[str, Any]):
-        """상세 정보 패널 업데이트"""
+    def _on_resize(self, event, panel: Dict[str, Any]):
+        """창 크기가 바뀌면 이전 크기의 배경을 폐기 (다음 전체 렌더링에서 다시 캐시)"""
+        panel['background'] = None
+    
+    def _on_layout_click(self, event, panel: Dict[str, Any]):
+        """솔루션 패널을 클릭하면 해당 솔루션을 그 창의 상세 정보 패널에 표시"""
+        layout_axes = panel['layout_axes']
+        if event.inaxes not in layout_axes:
+            return
         
-        ax.clear()
-        ax.axis('off')
+        index = layout_axes.index(event.inaxes)
+        # 상세/비교 보기 버튼은 가장 최근 결과를 쓰므로 최근 결과 창에서 클릭한 경우에만 선택 변경
+        if panel['solutions'] is self.solutions:
+            self.current_detail_index = index
+        self._update_detail_panel(panel, panel['solutions'][index])
+    
+    def _update_detail_panel(self, panel: Dict[str, Any], solution: Dict[str, Any]):
+        """상세 정보 패널 업데이트 (텍스트만 교체하고 패널 영역만 blitting)"""
         
         # 솔루션 정보 텍스트 생성
         fitness = solution.get('fitness', 0)
@@ -181,12 +378,9 @@ class ResultVisualizer:
         code = solution.get('code', 'N/A')
         generation = solution.get('generation', 'N/A')
         
-        layout = solution['layout']
-        main_count = len([r for r in layout if r.get('building_type') == 'main'])
-        sub_count = len([r for r in layout if r.get('building_type') == 'sub'])
-        
-        # 배치 통계
-        total_area = sum(r['width'] * r['height'] for r in layout)
+        # 배치 통계 (솔루션별 캐시)
+        stats = _compute_stats(solution)
+        total_area = stats['total_area']
         site_area = self.site_width * self.site_height
         utilization = (total_area / site_area) * 100
         
@@ -195,22 +389,43 @@ class ResultVisualizer:
             f"🔧 알고리즘: {method}  |  "
             f"📋 배치코드: {code}  |  "
             f"🔢 세대: {generation}\n"
-            f"🏭 공정수: 총 {len(layout)}개 (주공정 {main_count}개, 부공정 {sub_count}개)  |  "
+            f"🏭 공정수: 총 {stats['processes']}개 (주공정 {stats['main']}개, 부공정 {stats['sub']}개)  |  "
             f"📊 부지활용률: {utilization:.1f}%  |  "
             f"📐 총면적: {total_area:,.0f}mm²"
         )
         
-        ax.text(0, 0.5, detail_text, transform=ax.transAxes,
-               fontsize=11, verticalalignment='center',
-               bbox=dict(boxstyle="round,pad=0.5", facecolor='lightblue', alpha=0.3))
+        text = panel['text']
+        text.set_text(detail_text)
+        
+        # 캐시된 배경이 없으면 (첫 렌더링 전/리사이즈 직후) 유휴 시점의 전체 렌더링 한 번으로 합쳐서 요청
+        # (그 draw_event에서 텍스트가 그려짐)
+        ax = panel['ax']
+        canvas = ax.figure.canvas
+        if panel['background'] is None:
+            canvas.draw_idle()
+            return
+        
+        canvas.restore_region(panel['background'])
+        ax.draw_artist(text)
+        canvas.blit(panel['region'])
     
     def _add_control_buttons(self, fig):
-        """컨트롤 버튼 추가"""
+        """
+        컨트롤 버튼 추가
+        
+        Returns:
+            생성한 Button 목록 (호출자가 참조를 유지해야 클릭에 반응)
+        """
         
         # 버튼 영역
-        button_area = fig.add_axes([0.8, 0.02, 0.18, 0.08])
+        button_area = fig.add_axes([0.8, 0.02, 0.18, 0.12])
         button_area.axis('off')
         
+        # 고해상도 저장 버튼 (300 DPI로 다시 렌더링해 저장)
+        hires_btn_ax = fig.add_axes([0.81, 0.10, 0.17, 0.03])
+        hires_btn = Button(hires_btn_ax, '고해상도 저장 (300 DPI)', color='khaki')
+        hires_btn.on_clicked(lambda event: self._save_results(event, high_resolution=True))
+        
         # 상세 보기 버튼
         detail_btn_ax = fig.add_axes([0.81, 0.06, 0.08, 0.03])
         detail_btn = Button(detail_btn_ax, '상세보기', color='lightgreen')
@@ -230,21 +445,70 @@ class ResultVisualizer:
         report_btn_ax = fig.add_axes([0.90, 0.02, 0.08, 0.03])
         report_btn = Button(report_btn_ax, '리포트', color='lightgray')
         report_btn.on_clicked(self._generate_report)
+        
+        return [hires_btn, detail_btn, compare_btn, save_btn, report_btn]
     
     def _show_detailed_view(self, event):
         """상세 보기 창 표시"""
         if not self.solutions:
             return
         
-        # 새로운 창에서 첫 번째 솔루션 상세 표시
-        solution = self.solutions[0]
-        self._create_detailed_solution_view(solution)
+        # 선택된 솔루션 상세 표시 (기본: 첫 번째)
+        solution = self.solutions[self.current_detail_index]
+        
+        # 다른 솔루션을 보여주던 상세 창이 열려 있으면 창/컬러바를 다시 만들지 않고 내용만 교체
+        fig = self._view_figures.get(('detail',))
+        if fig is not None and plt.fignum_exists(fig.number) and self._detail_solution is not solution:
+            self._update_detailed_solution_view(solution)
+        
+        self._show_cached_view(('detail',), lambda: self._create_detailed_solution_view(solution))
+    
+    def _show_cached_view(self, key, create_view):
+        """
+        캐시된 보기 창이 열려 있으면 다시 띄우고, 없으면 새로 그려 캐시
+        
+        Args:
+            key: 캐시 키 (보기 종류)
+            create_view: 보기 그림을 만들어 반환하는 함수
+        """
+        fig = self._view_figures.get(key)
+        if fig is not None and plt.fignum_exists(fig.number):
+            fig.show()
+            return
+        
+        fig = create_view()
+        self._view_figures[key] = fig
+        fig.canvas.mpl_connect('close_event', lambda event: self._view_figures.pop(key, None))
+        plt.show()
     
     def _create_detailed_solution_view(self, solution: Dict[str, Any]):
-        """개별 솔루션 상세 보기 창"""
+        """개별 솔루션 상세 보기 창 생성 (표시는 호출자가 담당)"""
         
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-        fig.suptitle(f'상세 분석: 적합도 {solution["fitness"]:.2f}점', fontsize=16, fontweight='bold')
+        self._detail_title = fig.suptitle(f'상세 분석: 적합도 {solution["fitness"]:.2f}점', fontsize=16, fontweight='bold')
+        self._detail_axes = axes
+        self._adjacency_colorbar = None
+        
+        self._draw_detailed_panels(solution)
+        
+        fig.subplots_adjust(**self.DETAIL_VIEW_MARGINS)
+        return fig
+    
+    def _update_detailed_solution_view(self, solution: Dict[str, Any]):
+        """열려 있는 상세 보기 창의 내용을 다른 솔루션으로 교체 (창/컬러바는 재사용)"""
+        
+        for ax in self._detail_axes.flat:
+            ax.clear()
+        self._detail_title.set_text(f'상세 분석: 적합도 {solution["fitness"]:.2f}점')
+        
+        self._draw_detailed_panels(solution)
+        self._detail_axes[0, 0].figure.canvas.draw_idle()
+    
+    def _draw_detailed_panels(self, solution: Dict[str, Any]):
+        """상세 보기 창의 네 영역 그리기"""
+        
+        axes = self._detail_axes
+        self._detail_solution = solution
         
         # 1. 메인 배치도 (좌상)
         self._draw_detailed_layout(axes[0, 0], solution)
@@ -257,9 +521,6 @@ class ResultVisualizer:
         
         # 4. 배치 통계 (우하)
         self._draw_layout_statistics(axes[1, 1], solution)
-        
-        plt.tight_layout()
-        plt.show()
     
     def _draw_detailed_layout(self, ax, solution: Dict[str, Any]):
         """상세 배치도 그리기"""
@@ -279,7 +540,7 @@ class ResultVisualizer:
             size_text = f"{rect['width']}×{rect['height']}"
             ax.text(center_x, center_y - 15, size_text, 
                    ha='center', va='center', fontsize=8,
-                   bbox=dict(boxstyle="round,pad=0.1", facecolor='yellow', alpha=0.7))
+                   path_effects=SIZE_LABEL_PATH_EFFECTS)
     
     def _draw_adjacency_analysis(self, ax, solution: Dict[str, Any]):
         """인접성 분석 그래프"""
@@ -294,34 +555,43 @@ class ResultVisualizer:
         n = len(process_ids)
         
         if n > 1:
-            # 거리 매트릭스 계산
-            distance_matrix = np.zeros((n, n))
+            # 거리 매트릭스 계산 (중심점 간 거리, 브로드캐스팅으로 한 번에 계산, 대각선은 0)
+            cx = np.fromiter((r['x'] + r['width'] / 2 for r in layout), dtype=np.float64, count=n)
+            cy = np.fromiter((r['y'] + r['height'] / 2 for r in layout), dtype=np.float64, count=n)
+            distance_matrix = np.hypot(cx[:, None] - cx[None, :], cy[:, None] - cy[None, :])
             
-            for i, rect1 in enumerate(layout):
-                for j, rect2 in enumerate(layout):
-                    if i != j:
-                        # 중심점 간 거리
-                        cx1 = rect1['x'] + rect1['width'] / 2
-                        cy1 = rect1['y'] + rect1['height'] / 2
-                        cx2 = rect2['x'] + rect2['width'] / 2
-                        cy2 = rect2['y'] + rect2['height'] / 2
-                        
-                        distance = np.sqrt((cx2 - cx1)**2 + (cy2 - cy1)**2)
-                        distance_matrix[i, j] = distance
+            # 공정이 많으면 연속 공정 묶음 간 평균 거리로 축소 (히트맵 크기/눈금 수 제한)
+            tick_step = 1
+            if n > self.ADJACENCY_MAX_CELLS:
+                groups = np.array_split(np.arange(n), self.ADJACENCY_MAX_CELLS)
+                starts = np.array([group[0] for group in groups])
+                sizes = np.array([len(group) for group in groups], dtype=np.float64)
+                block_sums = np.add.reduceat(np.add.reduceat(distance_matrix, starts, axis=0), starts, axis=1)
+                distance_matrix = block_sums / np.outer(sizes, sizes)
+                process_ids = [f"{process_ids[group[0]]}~{process_ids[group[-1]]}" for group in groups]
+                tick_step = max(1, len(groups) // 10)
             
             # 히트맵 표시
             im = ax.imshow(distance_matrix, cmap='viridis_r', aspect='auto')
-            ax.set_xticks(range(n))
-            ax.set_yticks(range(n))
-            ax.set_xticklabels(process_ids, rotation=45)
-            ax.set_yticklabels(process_ids)
+            ticks = range(0, len(process_ids), tick_step)
+            ax.set_xticks(ticks)
+            ax.set_yticks(ticks)
+            ax.set_xticklabels(process_ids[::tick_step], rotation=45)
+            ax.set_yticklabels(process_ids[::tick_step])
             
-            # 컬러바 추가
-            plt.colorbar(im, ax=ax, label='거리 (mm)')
+            # 컬러바는 창마다 한 번만 만들고, 이후에는 새 히트맵에 연결만 갱신
+            colorbar = self._adjacency_colorbar
+            if colorbar is None:
+                self._adjacency_colorbar = plt.colorbar(im, ax=ax, label='거리 (mm)')
+            else:
+                colorbar.update_normal(im)
+                colorbar.ax.set_visible(True)
         
         else:
             ax.text(0.5, 0.5, '분석할 공정이 부족합니다', 
                    ha='center', va='center', transform=ax.transAxes)
+            if self._adjacency_colorbar is not None:
+                self._adjacency_colorbar.ax.set_visible(False)
     
     def _draw_fitness_breakdown(self, ax, solution: Dict[str, Any]):
         """적합도 분해 차트"""
@@ -358,28 +628,22 @@ class ResultVisualizer:
         ax.set_title('배치 통계', fontsize=14, fontweight='bold')
         ax.axis('off')
         
-        layout = solution['layout']
+        # 통계 계산 (솔루션별 캐시)
+        stats = _compute_stats(solution)
+        total_processes = stats['processes']
+        main_processes = stats['main']
+        sub_processes = stats['sub']
+        rotated_count = stats['rotated']
         
-        # 통계 계산
-        total_processes = len(layout)
-        main_processes = len([r for r in layout if r.get('building_type') == 'main'])
-        sub_processes = len([r for r in layout if r.get('building_type') == 'sub'])
-        
-        total_area = sum(r['width'] * r['height'] for r in layout)
+        total_area = stats['total_area']
         site_area = self.site_width * self.site_height
         utilization = (total_area / site_area) * 100
         
         # 배치 범위
-        min_x = min(r['x'] for r in layout) if layout else 0
-        max_x = max(r['x'] + r['width'] for r in layout) if layout else 0
-        min_y = min(r['y'] for r in layout) if layout else 0
-        max_y = max(r['y'] + r['height'] for r in layout) if layout else 0
-        
-        layout_width = max_x - min_x
-        layout_height = max_y - min_y
-        
-        # 회전된 공정 수
-        rotated_count = len([r for r in layout if r.get('rotated', False)])
+        min_x, max_x = stats['min_x'], stats['max_x']
+        min_y, max_y = stats['min_y'], stats['max_y']
+        layout_width = stats['layout_width']
+        layout_height = stats['layout_height']
         
         # 통계 텍스트 생성
         stats_text = f"""
@@ -417,21 +681,30 @@ class ResultVisualizer:
             return
         
         # 상위 2개 솔루션 비교
-        self._create_comparison_view(self.solutions[0], self.solutions[1])
+        solution1, solution2 = self.solutions[0], self.solutions[1]
+        
+        # 다른 솔루션을 보여주던 비교 창이 열려 있으면 축을 다시 만들지 않고 내용만 교체
+        fig = self._view_figures.get(('comparison',))
+        pair = self._comparison_pair
+        if (fig is not None and plt.fignum_exists(fig.number) and 
+                (pair is None or pair[0] is not solution1 or pair[1] is not solution2)):
+            self._update_comparison_view(solution1, solution2)
+        
+        self._show_cached_view(('comparison',), lambda: self._create_comparison_view(solution1, solution2))
     
     def _create_comparison_view(self, solution1: Dict[str, Any], solution2: Dict[str, Any]):
-        """두 솔루션 비교 보기"""
+        """두 솔루션 비교 보기 창 생성 (표시는 호출자가 담당)"""
         
         fig, axes = plt.subplots(2, 2, figsize=(16, 10))
         fig.suptitle('솔루션 비교 분석', fontsize=16, fontweight='bold')
         
-        # 솔루션 1 배치
-        axes[0, 0].set_title(f'솔루션 #1 (적합도: {solution1["fitness"]:.2f})', fontweight='bold')
-        self._draw_layout(axes[0, 0], solution1, title="", large=True)
-        
-        # 솔루션 2 배치
-        axes[0, 1].set_title(f'솔루션 #2 (적합도: {solution2["fitness"]:.2f})', fontweight='bold')
-        self._draw_layout(axes[0, 1], solution2, title="", large=True)
+        # 솔루션 1, 2 배치 (컬렉션은 비교 대상이 바뀔 때 재사용)
+        self._comparison_axes = axes
+        self._comparison_colls = (
+            self._draw_layout(axes[0, 0], solution1, title=f'솔루션 #1 (적합도: {solution1["fitness"]:.2f})', large=True),
+            self._draw_layout(axes[0, 1], solution2, title=f'솔루션 #2 (적합도: {solution2["fitness"]:.2f})', large=True)
+        )
+        self._comparison_pair = (solution1, solution2)
         
         # 적합도 비교
         self._draw_fitness_comparison(axes[1, 0], solution1, solution2)
@@ -439,8 +712,35 @@ class ResultVisualizer:
         # 통계 비교
         self._draw_statistics_comparison(axes[1, 1], solution1, solution2)
         
-        plt.tight_layout()
-        plt.show()
+        fig.subplots_adjust(**self.COMPARISON_VIEW_MARGINS)
+        return fig
+    
+    def _update_comparison_view(self, solution1: Dict[str, Any], solution2: Dict[str, Any]):
+        """열려 있는 비교 창의 내용을 새 솔루션으로 교체 (배치 축/눈금/격자는 그대로 재사용)"""
+        
+        axes = self._comparison_axes
+        
+        # 배치: 컬렉션의 경로/색상과 라벨만 교체
+        for number, (ax, collection, solution) in enumerate(
+                zip(axes[0], self._comparison_colls, (solution1, solution2)), 1):
+            layout = solution['layout']
+            rects, facecolors = self._layout_patches(layout)
+            collection.set_paths(rects)
+            collection.set_facecolors(facecolors)
+            
+            for label in list(ax.texts):
+                label.remove()
+            self._draw_layout_labels(ax, layout)
+            ax.set_title(f'솔루션 #{number} (적합도: {solution["fitness"]:.2f})', fontsize=12, fontweight='bold')
+        
+        # 적합도/통계 비교는 다시 그림
+        for ax in axes[1]:
+            ax.clear()
+        self._draw_fitness_comparison(axes[1, 0], solution1, solution2)
+        self._draw_statistics_comparison(axes[1, 1], solution1, solution2)
+        
+        self._comparison_pair = (solution1, solution2)
+        axes[0, 0].figure.canvas.draw_idle()
     
     def _draw_fitness_comparison(self, ax, solution1: Dict[str, Any], solution2: Dict[str, Any]):
         """적합도 비교 차트"""
@@ -482,32 +782,19 @@ class ResultVisualizer:
         ax.set_title('배치 통계 비교', fontweight='bold')
         ax.axis('off')
         
-        # 통계 계산
+        # 통계 계산 (솔루션별 캐시에 부지 활용률만 추가)
+        site_area = self.site_width * self.site_height
+        
         def calc_stats(solution):
-            layout = solution['layout']
-            total_area = sum(r['width'] * r['height'] for r in layout)
-            site_area = self.site_width * self.site_height
-            
-            min_x = min(r['x'] for r in layout) if layout else 0
-            max_x = max(r['x'] + r['width'] for r in layout) if layout else 0
-            min_y = min(r['y'] for r in layout) if layout else 0
-            max_y = max(r['y'] + r['height'] for r in layout) if layout else 0
-            
-            return {
-                'processes': len(layout),
-                'utilization': (total_area / site_area) * 100,
-                'layout_width': max_x - min_x,
-                'layout_height': max_y - min_y,
-                'rotated': len([r for r in layout if r.get('rotated', False)])
-            }
+            stats = _compute_stats(solution)
+            return dict(stats, utilization=(stats['total_area'] / site_area) * 100)
         
         stats1 = calc_stats(solution1)
         stats2 = calc_stats(solution2)
         
-        # 비교 테이블 생성
+        # 비교 테이블 생성 (머리글은 고정 문자열, 데이터 행만 포맷)
         comparison_text = f"""
-{'항목':<15} {'솔루션 #1':<12} {'솔루션 #2':<12} {'차이':<10}
-{'-'*50}
+{self.COMPARISON_HEADER}
 {'공정 수':<15} {stats1['processes']:<12} {stats2['processes']:<12} {stats2['processes']-stats1['processes']:+d}
 {'활용률 (%)':<15} {stats1['utilization']:<12.1f} {stats2['utilization']:<12.1f} {stats2['utilization']-stats1['utilization']:+.1f}
 {'배치 너비':<15} {stats1['layout_width']:<12.0f} {stats2['layout_width']:<12.0f} {stats2['layout_width']-stats1['layout_width']:+.0f}
@@ -524,8 +811,14 @@ class ResultVisualizer:
                fontsize=9, verticalalignment='top', fontfamily='monospace',
                bbox=dict(boxstyle="round,pad=0.3", facecolor='lightyellow', alpha=0.5))
     
-    def _save_results(self, event):
-        """결과 저장"""
+    def _save_results(self, event, high_resolution: bool = False):
+        """
+        결과 저장
+        
+        Args:
+            event: 버튼 클릭 이벤트
+            high_resolution: True면 300 DPI로 다시 렌더링해 저장 (기본은 화면에 그려진 버퍼를 그대로 저장)
+        """
         if not self.solutions:
             print("❌ 저장할 결과가 없습니다.")
             return
@@ -533,43 +826,50 @@ class ResultVisualizer:
         try:
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             
-            # 이미지 저장
+            # 이미지 저장 (결과 창의 Agg 버퍼를 재사용해 다시 렌더링하지 않음)
             img_filename = f"optimization_results_{timestamp}.png"
-            plt.savefig(img_filename, dpi=300, bbox_inches='tight')
+            fig = self.result_fig
+            canvas = fig.canvas
+            if high_resolution or not hasattr(canvas, 'buffer_rgba'):
+                fig.savefig(img_filename, dpi=300 if high_resolution else fig.dpi)
+                # 저장 렌더링이 화면 렌더러를 바꿨으므로 다음 상세 패널 갱신은 전체 렌더링으로 처리
+                if self._result_panel is not None:
+                    self._result_panel['background'] = None
+            else:
+                if fig.stale or getattr(canvas, 'renderer', None) is None:
+                    canvas.draw()
+                plt.imsave(img_filename, np.asarray(canvas.buffer_rgba()))
             
             # JSON 저장
-            import json
             json_filename = f"optimization_results_{timestamp}.json"
             
             # 직렬화 가능한 형태로 변환
-            serializable_solutions = []
-            for solution in self.solutions:
-                serializable_solution = {
+            serializable_solutions = [
+                {
                     'fitness': solution['fitness'],
                     'code': solution.get('code', ''),
                     'method': solution.get('method', ''),
                     'generation': solution.get('generation', ''),
                     'layout': [
-                        {
-                            'id': rect['id'],
-                            'x': rect['x'],
-                            'y': rect['y'],
-                            'width': rect['width'],
-                            'height': rect['height'],
-                            'rotated': rect.get('rotated', False),
-                            'building_type': rect.get('building_type', 'sub')
-                        }
+                        {key: rect.get(key, default) for key, default in LAYOUT_EXPORT_FIELDS}
                         for rect in solution['layout']
                     ]
                 }
-                serializable_solutions.append(serializable_solution)
+                for solution in self.solutions
+            ]
+            results = {
+                'timestamp': timestamp,
+                'site_dimensions': {'width': self.site_width, 'height': self.site_height},
+                'solutions': serializable_solutions
+            }
             
-            with open(json_filename, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'timestamp': timestamp,
-                    'site_dimensions': {'width': self.site_width, 'height': self.site_height},
-                    'solutions': serializable_solutions
-                }, f, indent=2, ensure_ascii=False)
+            # orjson이 있으면 바이트로 바로 직렬화, 없으면 표준 json 사용 (두 경로 모두 같은 2칸 들여쓰기 형식)
+            if ORJSON_AVAILABLE:
+                with open(json_filename, 'wb') as f:
+                    f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(json_filename, 'w', encoding='utf-8') as f:
+                    json.dump(results, f, indent=2, ensure_ascii=False)
             
             print(f"💾 결과 저장 완료:")
             print(f"   이미지: {img_filename}")
@@ -588,42 +888,50 @@ class ResultVisualizer:
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             report_filename = f"optimization_report_{timestamp}.txt"
             
-            with open(report_filename, 'w', encoding='utf-8') as f:
-                f.write("=" * 60 + "\n")
-                f.write("공정 배치 최적화 결과 리포트\n")
-                f.write("=" * 60 + "\n")
-                f.write(f"생성 시간: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"부지 크기: {self.site_width} × {self.site_height} mm\n")
-                f.write(f"분석된 솔루션 수: {len(self.solutions)}개\n\n")
-                
-                # 솔루션별 상세 정보
-                for i, solution in enumerate(self.solutions, 1):
-                    f.write(f"[솔루션 #{i}]\n")
-                    f.write(f"적합도: {solution['fitness']:.2f}점\n")
-                    f.write(f"생성 방법: {solution.get('method', 'unknown')}\n")
-                    f.write(f"배치 코드: {solution.get('code', 'N/A')}\n")
-                    
-                    layout = solution['layout']
-                    f.write(f"공정 수: {len(layout)}개\n")
-                    
-                    # 공정 목록
-                    f.write("공정 목록:\n")
-                    for rect in layout:
-                        rotation_str = " (90도 회전)" if rect.get('rotated', False) else ""
-                        f.write(f"  - {rect['id']}: {rect['width']}×{rect['height']}mm "
-                               f"@ ({rect['x']}, {rect['y']}){rotation_str}\n")
-                    
-                    f.write("\n" + "-" * 40 + "\n\n")
+            # 리포트 전체를 조각 목록으로 만든 뒤 한 번에 기록
+            parts = [
+                "=" * 60 + "\n",
+                "공정 배치 최적화 결과 리포트\n",
+                "=" * 60 + "\n",
+                f"생성 시간: {time.strftime('%Y-%m-%d %H:%M:%S')}\n",
+                f"부지 크기: {self.site_width} × {self.site_height} mm\n",
+                f"분석된 솔루션 수: {len(self.solutions)}개\n\n"
+            ]
+            
+            # 솔루션별 상세 정보
+            for i, solution in enumerate(self.solutions, 1):
+                layout = solution['layout']
+                parts.append(
+                    f"[솔루션 #{i}]\n"
+                    f"적합도: {solution['fitness']:.2f}점\n"
+                    f"생성 방법: {solution.get('method', 'unknown')}\n"
+                    f"배치 코드: {solution.get('code', 'N/A')}\n"
+                    f"공정 수: {len(layout)}개\n"
+                    "공정 목록:\n"
+                )
                 
-                # 요약 통계
-                f.write("[요약 통계]\n")
-                if self.solutions:
-                    fitnesses = [s['fitness'] for s in self.solutions]
-                    f.write(f"최고 적합도: {max(fitnesses):.2f}점\n")
-                    f.write(f"최저 적합도: {min(fitnesses):.2f}점\n")
-                    f.write(f"평균 적합도: {sum(fitnesses)/len(fitnesses):.2f}점\n")
+                # 공정 목록
+                parts.extend(
+                    f"  - {rect['id']}: {rect['width']}×{rect['height']}mm "
+                    f"@ ({rect['x']}, {rect['y']}){' (90도 회전)' if rect.get('rotated', False) else ''}\n"
+                    for rect in layout
+                )
                 
-                f.write("\n" + "=" * 60 + "\n")
+                parts.append("\n" + "-" * 40 + "\n\n")
+            
+            # 요약 통계
+            parts.append("[요약 통계]\n")
+            fitnesses = [s['fitness'] for s in self.solutions]
+            parts.append(
+                f"최고 적합도: {max(fitnesses):.2f}점\n"
+                f"최저 적합도: {min(fitnesses):.2f}점\n"
+                f"평균 적합도: {sum(fitnesses)/len(fitnesses):.2f}점\n"
+            )
+            
+            parts.append("\n" + "=" * 60 + "\n")
+            
+            with open(report_filename, 'w', encoding='utf-8') as f:
+                f.write(''.join(parts))
             
             print(f"📋 리포트 생성 완료: {report_filename}")
             
@@ -646,13 +954,13 @@ class SimpleResultVisualizer:
             print("❌ 표시할 솔루션이 없습니다.")
             return
         
-        print(f"\n🏆 최적화 결과 ({len(solutions)}개 솔루션)")
-        print("=" * 80)
+        # 출력 줄을 모아 한 번에 기록
+        out = [f"\n🏆 최적화 결과 ({len(solutions)}개 솔루션)", "=" * 80]
         
         # 상위 4개 상세 표시
         top_4 = solutions[:4]
-        print("📊 상위 4개 솔루션 (상세):")
-        print("-" * 80)
+        out.append("📊 상위 4개 솔루션 (상세):")
+        out.append("-" * 80)
         
         for i, solution in enumerate(top_4, 1):
             layout = solution['layout']
@@ -660,36 +968,36 @@ class SimpleResultVisualizer:
             code = solution.get('code', 'N/A')
             method = solution.get('method', 'unknown')
             
-            print(f"#{i}. 적합도: {fitness:.2f}점 | 방법: {method} | 코드: {code}")
+            out.append(f"#{i}. 적합도: {fitness:.2f}점 | 방법: {method} | 코드: {code}")
             
-            # 공정 목록
-            main_processes = [r for r in layout if r.get('building_type') == 'main']
-            sub_processes = [r for r in layout if r.get('building_type') == 'sub']
-            
-            print(f"   공정: 총 {len(layout)}개 (주공정 {len(main_processes)}개, 부공정 {len(sub_processes)}개)")
+            # 공정 목록 (개수는 솔루션별 캐시 사용)
+            stats = _compute_stats(solution)
+            out.append(f"   공정: 총 {stats['processes']}개 (주공정 {stats['main']}개, 부공정 {stats['sub']}개)")
             
             # 주공정 순서
-            if main_processes:
+            if stats['main']:
+                main_processes = [r for r in layout if r.get('building_type') == 'main']
                 main_processes.sort(key=lambda x: x.get('main_process_sequence', 999))
                 main_sequence = ' → '.join([p['id'] for p in main_processes])
-                print(f"   주공정 순서: {main_sequence}")
+                out.append(f"   주공정 순서: {main_sequence}")
             
-            print()
+            out.append("")
         
         # 나머지 간단히 표시
         if len(solutions) > 4:
             remaining = solutions[4:8]
-            print("📋 나머지 솔루션 (요약):")
-            print("-" * 40)
+            out.append("📋 나머지 솔루션 (요약):")
+            out.append("-" * 40)
             
             for i, solution in enumerate(remaining, 5):
                 fitness = solution['fitness']
                 code = solution.get('code', 'N/A')
                 method = solution.get('method', 'unknown')
                 
-                print(f"#{i}. {fitness:.2f}점 | {method} | {code[:20]}...")
+                out.append(f"#{i}. {fitness:.2f}점 | {method} | {code[:20]}...")
         
-        print("=" * 80)
+        out.append("=" * 80)
+        sys.stdout.write('\n'.join(out) + '\n')
 
 
 if __name__ == "__main__":
@@ -699,20 +1007,32 @@ if __name__ == "__main__":
     # 테스트 데이터 생성
     site_width, site_height = 1000, 800
     
+    # 적합도 노이즈는 한 번에 생성하고, 공정은 기본 배치를 복사해 위치만 이동
+    noise = np.random.normal(0, 10, size=6)
+    base_layout = (
+        {'id': 'A', 'x': 100, 'y': 100, 'width': 150, 'height': 100, 'building_type': 'main', 'rotated': False, 'main_process_sequence': 1},
+        {'id': 'B', 'x': 300, 'y': 150, 'width': 200, 'height': 120, 'building_type': 'main', 'rotated': False, 'main_process_sequence': 2},
+        {'id': 'C', 'x': 200, 'y': 300, 'width': 180, 'height': 90, 'building_type': 'main', 'rotated': False, 'main_process_sequence': 3},
+        {'id': 'W', 'x': 500, 'y': 200, 'width': 100, 'height': 80, 'building_type': 'sub', 'rotated': False},
+    )
+    offsets = ((10, 5), (15, 8), (12, 10), (8, 12))
+    
     test_solutions = []
     for i in range(6):
-        fitness = 1000 - i * 50 + np.random.normal(0, 10)
+        layout = []
+        for base_rect, (dx, dy) in zip(base_layout, offsets):
+            rect = base_rect.copy()
+            rect['x'] += i * dx
+            rect['y'] += i * dy
+            layout.append(rect)
+        layout[1]['rotated'] = i % 2 == 1
+        
         solution = {
-            'fitness': fitness,
+            'fitness': 1000 - i * 50 + noise[i],
             'code': f'AO-b(50)-BR-c(30)-C{"R" if i%2 else "O"}',
             'method': 'exhaustive_search' if i < 3 else 'genetic_algorithm',
             'generation': i + 1,
-            'layout': [
-                {'id': 'A', 'x': 100+i*10, 'y': 100+i*5, 'width': 150, 'height': 100, 'building_type': 'main', 'rotated': False, 'main_process_sequence': 1},
-                {'id': 'B', 'x': 300+i*15, 'y': 150+i*8, 'width': 200, 'height': 120, 'building_type': 'main', 'rotated': i%2==1, 'main_process_sequence': 2},
-                {'id': 'C', 'x': 200+i*12, 'y': 300+i*10, 'width': 180, 'height': 90, 'building_type': 'main', 'rotated': False, 'main_process_sequence': 3},
-                {'id': 'W', 'x': 500+i*8, 'y': 200+i*12, 'width': 100, 'height': 80, 'building_type': 'sub', 'rotated': False},
-            ]
+            'layout': layout
         }
         test_solutions.append(solution)
     